@@ -0,0 +1,27 @@
+-- Migration: Add outbox_events table
+-- Description: Stores notification events written together with order updates,
+--              delivered by the outbox dispatcher
+-- Date: 2026-10-16
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id SERIAL PRIMARY KEY,
+    kind VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT now(),
+    delivered_at TIMESTAMP NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_outbox_events_id ON outbox_events (id);
+CREATE INDEX IF NOT EXISTS ix_outbox_events_delivered_at ON outbox_events (delivered_at);
+
+COMMENT ON TABLE outbox_events IS 'Events (order fills, profit milestones) pending notification delivery';
+COMMENT ON COLUMN outbox_events.delivered_at IS 'NULL until the notification was sent';
+
+COMMIT;
+
+-- Rollback script (in case needed)
+-- BEGIN;
+-- DROP TABLE IF EXISTS outbox_events;
+-- COMMIT;
@@ -29,7 +29,8 @@ class Settings:
     SECRET_KEY: str = os.getenv("SECRET_KEY", "")
 
     # Monitoring
-    ORDER_CHECK_INTERVAL: int = int(os.getenv("ORDER_CHECK_INTERVAL", "10"))
+    # Fills arrive over WebSocket; polling is only a reconciliation sweep
+    ORDER_CHECK_INTERVAL: int = int(os.getenv("ORDER_CHECK_INTERVAL", "60"))
     HEALTH_CHECK_INTERVAL: int = int(os.getenv("HEALTH_CHECK_INTERVAL", "300"))
 
     # Limits
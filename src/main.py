@@ -5,6 +5,7 @@ import sys
 from contextlib import asynccontextmanager
 
 from aiogram import Bot, Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.fsm.storage.redis import RedisStorage
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
@@ -16,10 +17,16 @@ from src.services.grid_strategy import GridStrategy
 from src.services.bot_manager import BotManager
 from src.services.order_monitor import OrderMonitor
 from src.services.notification import NotificationService
+from src.services.outbox import OutboxDispatcher
 from src.services.health_check import HealthCheck
 
 from src.bot.handlers import start, api_setup, balance, manage_bots, create_bot
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used otherwise
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
@@ -33,6 +40,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _orjson_dumps(obj) -> str:
+    """Serialize Telegram API payload with orjson."""
+    return orjson.dumps(obj).decode()
+
+
+def create_bot_session() -> AiohttpSession:
+    """
+    Create HTTP session for the Telegram bot.
+
+    Uses orjson for request/response (de)serialization when available,
+    notifications and polling updates go through it on every call.
+    """
+    if orjson is None:
+        return AiohttpSession()
+
+    return AiohttpSession(json_loads=orjson.loads, json_dumps=_orjson_dumps)
+
+
 # Dependency injection for database session
 async def get_db_session() -> AsyncSession:
     """Get database session."""
@@ -53,6 +78,7 @@ class Application:
         self.bot_manager = None
         self.order_monitor = None
         self.notification_service = None
+        self.outbox_dispatcher = None
         self.health_check = None
 
     async def setup(self):
@@ -73,7 +99,10 @@ class Application:
         logger.info(f"Redis connected: {settings.REDIS_HOST}:{settings.REDIS_PORT}")
 
         # Initialize Telegram bot with Redis storage for FSM
-        self.bot = Bot(token=settings.TELEGRAM_BOT_TOKEN)
+        self.bot = Bot(
+            token=settings.TELEGRAM_BOT_TOKEN,
+            session=create_bot_session()
+        )
         storage = RedisStorage(redis=self.redis)
         self.dp = Dispatcher(storage=storage)
         logger.info("FSM storage: RedisStorage (states persist across restarts)")
@@ -89,6 +118,11 @@ class Application:
 
         # Initialize services (they will be created per-request with DB session)
         self.notification_service = NotificationService(self.bot)
+        self.outbox_dispatcher = OutboxDispatcher(
+            db_factory=lambda: AsyncSessionLocal(),
+            notification_service=self.notification_service
+        )
+        self.outbox_dispatcher.start()
         logger.info("Services initialized")
 
         # Register handlers
@@ -101,7 +135,8 @@ class Application:
 
         # Restore active bots
         async with AsyncSessionLocal() as session:
-            mexc_service = MEXCService(session)
+            # Shared by monitor tasks, so credential lookups use own sessions
+            mexc_service = MEXCService(session, db_factory=lambda: AsyncSessionLocal())
             grid_strategy = GridStrategy(session, mexc_service)
             bot_manager = BotManager(session, mexc_service, grid_strategy)
 
@@ -113,7 +148,8 @@ class Application:
                 db_factory=lambda: AsyncSessionLocal(),
                 mexc_service=mexc_service,
                 grid_strategy=grid_strategy,
-                notification_service=self.notification_service
+                notification_service=self.notification_service,
+                outbox=self.outbox_dispatcher
             )
 
             # Start monitoring for all active bots
@@ -129,6 +165,13 @@ class Application:
                 self.order_monitor.start_monitoring(bot.id)
                 logger.info(f"Started monitoring for bot {bot.id}")
 
+            # Stream prices of active pairs over one WebSocket connection
+            self.mexc_service = mexc_service
+            if active_bots:
+                await mexc_service.start_price_stream(
+                    list({bot.symbol for bot in active_bots})
+                )
+
             # Start health check service
             self.health_check = HealthCheck(
                 db=session,
@@ -170,6 +213,16 @@ class Application:
             await self.order_monitor.stop_all()
             logger.info("Order monitoring stopped")
 
+        # Stop outbox dispatcher (undelivered events stay in DB)
+        if self.outbox_dispatcher:
+            await self.outbox_dispatcher.stop()
+            logger.info("Outbox dispatcher stopped")
+
+        # Flush queued notifications
+        if self.notification_service:
+            await self.notification_service.close()
+            logger.info("Notification queue flushed")
+
         # Close MEXC connections
         if self.mexc_service:
             await self.mexc_service.close_all()
@@ -3,5 +3,6 @@ from src.models.user import User
 from src.models.grid_bot import GridBot
 from src.models.order import GridOrder
 from src.models.bot_log import BotLog
+from src.models.outbox_event import OutboxEvent
 
-__all__ = ["User", "GridBot", "GridOrder", "BotLog"]
+__all__ = ["User", "GridBot", "GridOrder", "BotLog", "OutboxEvent"]
@@ -0,0 +1,46 @@
+"""OutboxEvent model."""
+from decimal import Decimal
+from sqlalchemy import Column, Integer, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from src.core.database import Base
+
+
+def _to_json(value):
+    """Convert Decimals (recursively) to strings for JSONB storage."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    return value
+
+
+class OutboxEvent(Base):
+    """
+    OutboxEvent model for events to be delivered after commit.
+
+    Written in the same transaction as the change that caused it and
+    drained by OutboxDispatcher, which sets delivered_at once the message
+    was sent.
+    """
+
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Event kind: order_filled, profit_milestone
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSONB, nullable=False)
+
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    delivered_at = Column(TIMESTAMP, nullable=True, index=True)
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, kind={self.kind}, delivered_at={self.delivered_at})>"
+
+    @classmethod
+    def create(cls, kind: str, payload: dict):
+        """Create event (Decimal values are stored as strings)."""
+        return cls(kind=kind, payload=_to_json(payload))
@@ -1,6 +1,6 @@
 """Grid Trading Strategy implementation."""
 from decimal import Decimal
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Callable
 from datetime import datetime
 import logging
 import math
@@ -11,7 +11,7 @@ from src.models.grid_bot import GridBot
 from src.models.order import GridOrder
 from src.models.bot_log import BotLog
 from src.services.mexc_service import MEXCService, MEXCError
-from src.utils.helpers import parse_decimal, round_down, split_symbol
+from src.utils.helpers import parse_decimal, round_down, make_rounder, split_symbol
 from src.utils.validators import validate_price_range, validate_grid_levels
 
 logger = logging.getLogger(__name__)
@@ -158,12 +158,12 @@ class GridStrategy:
             raise GridStrategyError("Только arithmetic grid поддерживается в MVP")
 
         # Calculate step
-        step = (upper_price - lower_price) / Decimal(str(grid_levels))
+        step = (upper_price - lower_price) / Decimal(grid_levels)
 
         # Generate levels
         levels = []
         for i in range(grid_levels + 1):
-            level = lower_price + (step * Decimal(str(i)))
+            level = lower_price + (step * Decimal(i))
             levels.append(level)
 
         return levels
@@ -281,6 +281,7 @@ class GridStrategy:
             amount_precision = exchange_info['amount_precision']
             price_precision = exchange_info['price_precision']
             min_order_amount = exchange_info['min_order_amount']
+            round_price = make_rounder(price_precision)
 
             logger.info(
                 f"Exchange info for {bot.symbol}: "
@@ -317,7 +318,7 @@ class GridStrategy:
             # Create BUY limit orders (first half of price_levels - lower prices)
             for level_idx, amount in order_amounts.items():
                 if level_idx < num_buy_levels:
-                    price = round_down(price_levels[level_idx], price_precision)
+                    price = round_price(price_levels[level_idx])
 
                     try:
                         order = await self.mexc.create_limit_order(
@@ -408,7 +409,7 @@ class GridStrategy:
             if total_sell_amount > 0:
                 for level_idx, amount in order_amounts.items():
                     if level_idx >= num_buy_levels:
-                        price = round_down(price_levels[level_idx], price_precision)
+                        price = round_price(price_levels[level_idx])
 
                         try:
                             order = await self.mexc.create_limit_order(
@@ -510,6 +511,7 @@ class GridStrategy:
             amount_precision = exchange_info['amount_precision']
             price_precision = exchange_info['price_precision']
             min_order_amount = exchange_info['min_order_amount']
+            round_price = make_rounder(price_precision)
 
             logger.info(
                 f"Exchange info for {bot.symbol}: "
@@ -527,8 +529,8 @@ class GridStrategy:
             buy_order_params = []
             for i in range(1, bot.buy_orders_count + 1):
                 # Calculate price: starting_price - (i * flat_increment)
-                price = starting_price - (bot.flat_increment * Decimal(str(i)))
-                price = round_down(price, price_precision)
+                price = starting_price - (bot.flat_increment * Decimal(i))
+                price = round_price(price)
 
                 # Calculate amount to achieve exact cost in quote currency
                 amount = calculate_order_amount_for_cost(
@@ -600,8 +602,8 @@ class GridStrategy:
             # Use same calculation method to ensure accuracy
             total_sell_amount = Decimal('0')
             for i in range(1, bot.sell_orders_count + 1):
-                price = starting_price + (bot.flat_increment * Decimal(str(i)))
-                price = round_down(price, price_precision)
+                price = starting_price + (bot.flat_increment * Decimal(i))
+                price = round_price(price)
                 amount = calculate_order_amount_for_cost(
                     order_size=bot.order_size,
                     price=price,
@@ -660,8 +662,8 @@ class GridStrategy:
                 sell_order_params = []
                 for i in range(1, bot.sell_orders_count + 1):
                     # Calculate price: starting_price + (i * flat_increment)
-                    price = starting_price + (bot.flat_increment * Decimal(str(i)))
-                    price = round_down(price, price_precision)
+                    price = starting_price + (bot.flat_increment * Decimal(i))
+                    price = round_price(price)
 
                     # Calculate amount to achieve exact cost in quote currency
                     amount = calculate_order_amount_for_cost(
@@ -746,7 +748,11 @@ class GridStrategy:
             await self.db.rollback()
             raise GridStrategyError(f"Ошибка создания ордеров: {str(e)}")
 
-    async def handle_filled_order_flat(self, order_id: int) -> dict:
+    async def handle_filled_order_flat(
+        self,
+        order_id: int,
+        outbox_events: Optional[Callable[[dict], list]] = None
+    ) -> dict:
         """
         Handle filled order for FLAT GRID bot and create counter order.
 
@@ -763,6 +769,8 @@ class GridStrategy:
 
         Args:
             order_id: Order ID in database
+            outbox_events: Builds OutboxEvents from the returned dict; they
+                are committed in the same transaction as the order update
 
         Returns:
             {
@@ -934,10 +942,10 @@ class GridStrategy:
             # Update bot activity
             bot.last_activity_at = datetime.utcnow()
 
-            # Commit changes
-            await self.db.commit()
+            # Assign new order id before building the result
+            await self.db.flush()
 
-            return {
+            fill = {
                 'new_order': {
                     'id': new_order.id if new_order else None,
                     'side': new_order.side if new_order else None,
@@ -954,12 +962,25 @@ class GridStrategy:
                 }
             }
 
+            # Caller's events commit in the same transaction as the fill
+            if outbox_events is not None:
+                self.db.add_all(outbox_events(fill))
+
+            # Commit changes
+            await self.db.commit()
+
+            return fill
+
         except Exception as e:
             logger.error(f"Error handling flat grid filled order {order_id}: {e}")
             await self.db.rollback()
             raise GridStrategyError(f"Ошибка обработки ордера: {str(e)}")
 
-    async def handle_filled_order(self, order_id: int) -> dict:
+    async def handle_filled_order(
+        self,
+        order_id: int,
+        outbox_events: Optional[Callable[[dict], list]] = None
+    ) -> dict:
         """
         Handle filled order and create counter order.
 
@@ -980,6 +1001,8 @@ class GridStrategy:
 
         Args:
             order_id: Order ID in database
+            outbox_events: Builds OutboxEvents from the returned dict; they
+                are committed in the same transaction as the order update
 
         Returns:
             {
@@ -1012,7 +1035,7 @@ class GridStrategy:
         # Route to appropriate handler based on grid type
         if bot.grid_type == 'flat':
             logger.info(f"Routing to flat grid handler for order {order_id}")
-            return await self.handle_filled_order_flat(order_id)
+            return await self.handle_filled_order_flat(order_id, outbox_events)
 
         # Range grid logic (original implementation)
         try:
@@ -1132,10 +1155,10 @@ class GridStrategy:
             # Update bot activity
             bot.last_activity_at = datetime.utcnow()
 
-            # Commit changes
-            await self.db.commit()
+            # Assign new order id before building the result
+            await self.db.flush()
 
-            return {
+            fill = {
                 'new_order': {
                     'id': new_order.id if new_order else None,
                     'side': new_order.side if new_order else None,
@@ -1152,6 +1175,15 @@ class GridStrategy:
                 }
             }
 
+            # Caller's events commit in the same transaction as the fill
+            if outbox_events is not None:
+                self.db.add_all(outbox_events(fill))
+
+            # Commit changes
+            await self.db.commit()
+
+            return fill
+
         except Exception as e:
             logger.error(f"Error handling filled order {order_id}: {e}")
             await self.db.rollback()
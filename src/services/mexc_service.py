@@ -1,37 +1,490 @@
 """MEXC Exchange Service using CCXT."""
+import asyncio
+import aiohttp
+from collections import OrderedDict
 import ccxt.async_support as ccxt
+import ccxt.pro as ccxtpro
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional, Dict, List
+from operator import itemgetter
+from typing import Optional, Dict, List, Set, Tuple, AsyncIterator
 import logging
-from sqlalchemy import select
+import time
+from sqlalchemy import select, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import User
 from src.core.security import security
-from src.utils.helpers import parse_decimal, retry_async, split_symbol
+from src.utils.helpers import parse_decimal, fast_decimal, retry_async, split_symbol
 from src.utils.validators import ValidationError
-from src.utils.cache import price_cache
+from src.utils.cache import price_cache, balance_cache
 
 logger = logging.getLogger(__name__)
 
+# Users whose cached balance is stale because they placed/cancelled orders
+# since the last fetch. Module-level since MEXCService is created per request.
+_balance_dirty: Set[int] = set()
+
+# Shared HTTP session for all exchange instances. Exchanges built with an
+# external session don't close it in exchange.close(), so TCP/TLS connections
+# and DNS lookups are reused across calls.
+_http_session: Optional[aiohttp.ClientSession] = None
+
+# Long-lived authenticated exchange per user: (encrypted keys, exchange,
+# last used). Markets and signing setup are kept across calls and MEXCService
+# instances, so e.g. fetch_order doesn't reload markets on every call.
+# Kept in LRU order; each instance holds a full markets table, so at most
+# _MAX_USER_EXCHANGES are kept and ones idle longer than
+# _USER_EXCHANGE_IDLE_SECONDS are dropped.
+_MAX_USER_EXCHANGES = 100
+_USER_EXCHANGE_IDLE_SECONDS = 1800
+_user_exchanges: Dict[int, Tuple[Tuple[str, str], ccxt.mexc, float]] = OrderedDict()
+
+# Dropped exchanges may still be used by in-flight calls (close() detaches
+# the HTTP session), so they are closed only after a grace period longer
+# than any call with its retries. Pending closes: task -> exchange.
+_EXCHANGE_CLOSE_GRACE_SECONDS = 300
+_pending_closes: Dict[asyncio.Task, ccxt.mexc] = {}
+
+# Long-lived exchange used by test_api_keys() with keys swapped per test,
+# so markets and connections are reused across /settings flows
+_probe_exchange: Optional[ccxt.mexc] = None
+_probe_lock = asyncio.Lock()
+
+# Max concurrent MEXC REST requests per process. Keeps bursts within MEXC's
+# rate limit instead of triggering "too frequent" errors and retries.
+_REQUEST_CONCURRENCY = 10
+_request_semaphore = asyncio.Semaphore(_REQUEST_CONCURRENCY)
+
+# Global pacing of MEXC REST requests: all users and bots share one IP limit,
+# so request starts are spaced out no matter how many bots are checked at once
+_REQUESTS_PER_SECOND = 10
+_pace_lock = asyncio.Lock()
+_next_request_at = 0.0
+
+# Max concurrent cancel_order requests per cancel_orders_batch() call
+_CANCEL_CONCURRENCY = 10
+
+# Max concurrent fetch_order calls per get_orders_by_ids() call, so one bot
+# with many fills doesn't take every request semaphore slot
+_ORDER_FETCH_CONCURRENCY = 8
+
+# Rate-limit errors back off with jitter instead of hammering MEXC again,
+# timeouts retry on a linear schedule (DDoSProtection covers RateLimitExceeded)
+_BACKOFF_POLICY = {
+    ccxt.DDoSProtection: 'exponential',
+    ccxt.RequestTimeout: 'linear',
+}
+
+
+async def _pace():
+    """Wait for the next free MEXC request slot."""
+    global _next_request_at
+    async with _pace_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + 1 / _REQUESTS_PER_SECOND
+
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+
+def _defer_requests(exchange: Optional[ccxt.mexc]):
+    """
+    Hold back all MEXC requests for the Retry-After of a 429 response.
+
+    Args:
+        exchange: Exchange whose last request was rate limited
+    """
+    global _next_request_at
+    headers = getattr(exchange, 'last_response_headers', None) or {}
+    retry_after = next(
+        (value for name, value in headers.items() if name.lower() == 'retry-after'),
+        None
+    )
+    if retry_after is None:
+        return
+
+    try:
+        seconds = float(retry_after)
+    except (TypeError, ValueError):
+        return
+
+    logger.warning(f"MEXC rate limit hit, pausing requests for {seconds:.1f}s")
+    _next_request_at = max(_next_request_at, time.monotonic() + seconds)
+
+
+async def _close_exchange(exchange: ccxt.mexc):
+    """Close exchange, logging errors."""
+    try:
+        await exchange.close()
+    except Exception as e:
+        logger.error(f"Error closing exchange connection: {e}")
+
+
+def _close_later(exchange: ccxt.mexc):
+    """Close dropped exchange once calls still using it have finished."""
+    async def close():
+        await asyncio.sleep(_EXCHANGE_CLOSE_GRACE_SECONDS)
+        await _close_exchange(exchange)
+
+    task = asyncio.create_task(close())
+    _pending_closes[task] = exchange
+    task.add_done_callback(_pending_closes.pop)
+
+
+async def _close_pending():
+    """Close dropped exchanges now, without waiting for the grace period."""
+    for task, exchange in list(_pending_closes.items()):
+        task.cancel()
+        await _close_exchange(exchange)
+
+
+def _evict_user_exchanges():
+    """Drop least recently used user exchanges over the limit or idle too long."""
+    now = time.monotonic()
+    while _user_exchanges:
+        user_id, (_, exchange, last_used) = next(iter(_user_exchanges.items()))
+        if (
+            len(_user_exchanges) <= _MAX_USER_EXCHANGES
+            and now - last_used < _USER_EXCHANGE_IDLE_SECONDS
+        ):
+            break
+
+        del _user_exchanges[user_id]
+        _close_later(exchange)
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Get (or lazily create) shared keep-alive HTTP session."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                keepalive_timeout=60,
+                ttl_dns_cache=600,
+            )
+        )
+    return _http_session
+
+
+def _create_exchange(config: dict) -> ccxt.mexc:
+    """Create MEXC exchange instance on top of shared HTTP session."""
+    return ccxt.mexc({**config, 'session': _get_http_session()})
+
+
+def _get_probe_exchange() -> ccxt.mexc:
+    """Get (or lazily create) exchange used for testing API keys."""
+    global _probe_exchange
+    if _probe_exchange is None:
+        _probe_exchange = _create_exchange({
+            'enableRateLimit': True,
+            'options': {'defaultType': 'spot'}
+        })
+    return _probe_exchange
+
 
 class MEXCError(Exception):
     """MEXC API error."""
     pass
 
 
+class MEXCAuthError(MEXCError):
+    """Invalid or revoked API keys (including invalid request signature)."""
+    pass
+
+
+@dataclass(frozen=True)
+class PrecisionSpec:
+    """Trading rules for one market, prebuilt from load_markets()."""
+
+    symbol: str
+    base: str
+    quote: str
+    min_order_amount: Decimal
+    min_order_cost: Decimal
+    price_precision: int
+    amount_precision: int
+    limits: dict
+    active: bool
+
+    @classmethod
+    def from_market(cls, symbol: str, market: dict) -> 'PrecisionSpec':
+        """Build spec from CCXT market structure."""
+        precision = market.get('precision', {})
+        return cls(
+            symbol=symbol,
+            base=market['base'],
+            quote=market['quote'],
+            min_order_amount=parse_decimal(market['limits']['amount']['min']),
+            min_order_cost=parse_decimal(market['limits']['cost']['min']),
+            price_precision=precision.get('price', 8),
+            amount_precision=precision.get('amount', 8),
+            limits=market['limits'],
+            active=market.get('active', True),
+        )
+
+    def as_dict(self) -> dict:
+        """Exchange info dict as returned by MEXCService.get_exchange_info()."""
+        return {
+            'min_order_amount': self.min_order_amount,
+            'min_order_cost': self.min_order_cost,
+            'price_precision': self.price_precision,
+            'amount_precision': self.amount_precision,
+            'limits': self.limits,
+            'active': self.active,
+            'symbol': self.symbol,
+            'base': self.base,
+            'quote': self.quote,
+        }
+
+
+# Only encrypted key columns are needed to build an exchange instance
+_USER_KEYS_STMT = select(User.mexc_api_key, User.mexc_api_secret).where(
+    User.id == bindparam('uid')
+)
+
+
+_DEC_ZERO = Decimal(0)
+
+# Fields of CCXT unified order structure used by get_open_orders()
+_open_order_fields = itemgetter(
+    'id', 'symbol', 'status', 'side', 'price', 'amount', 'filled', 'remaining', 'timestamp'
+)
+
+
+def _pd(value) -> Decimal:
+    """fast_decimal() that skips parsing for zero/missing values."""
+    if value is None or value == 0 or value == '0':
+        return _DEC_ZERO
+    return fast_decimal(value)
+
+
+def _format_order_status(order: dict) -> dict:
+    """Convert CCXT order to get_order_status() response dict."""
+    # Handle fee field safely (can be None or dict)
+    fee_data = order.get('fee') or {}
+
+    return {
+        'order_id': str(order['id']),
+        'status': order['status'],
+        'side': order['side'],
+        'price': fast_decimal(order.get('price', 0)),
+        'amount': fast_decimal(order.get('amount', 0)),
+        'filled': fast_decimal(order.get('filled', 0)),
+        'remaining': fast_decimal(order.get('remaining', 0)),
+        'fee': fast_decimal(fee_data.get('cost', 0)),
+        'fee_currency': fee_data.get('currency'),
+        'timestamp': order.get('timestamp'),
+        'average_price': fast_decimal(order.get('average', 0)),
+    }
+
+
+def _format_open_orders(orders: List[dict]) -> List[dict]:
+    """Convert CCXT open orders to get_open_orders() response dicts."""
+    result = []
+    for order in orders:
+        if not order:
+            continue
+
+        (order_id, order_symbol, status, side, price,
+         amount, filled, remaining, timestamp) = _open_order_fields(order)
+
+        result.append({
+            'order_id': str(order_id),
+            'symbol': order_symbol,
+            'status': status,
+            'side': side,
+            'price': _pd(price),
+            'amount': _pd(amount),
+            'filled': _pd(filled),
+            'remaining': _pd(remaining),
+            'timestamp': timestamp,
+        })
+
+    return result
+
+
+# Shared WebSocket ticker stream (one connection for all users)
+_price_stream_task: Optional[asyncio.Task] = None
+_price_stream_symbols: Set[str] = set()
+
+# Per-symbol trading rules from load_markets(). Reloaded when older than
+# _PRECISION_TABLE_TTL (tick/step size changes) or when a symbol is missing
+# (new listings), at most once per _PRECISION_MISS_RELOAD_INTERVAL
+_PRECISION_TABLE_TTL = 3600
+_PRECISION_MISS_RELOAD_INTERVAL = 60
+_precision_table: Dict[str, PrecisionSpec] = {}
+_precision_loaded_at = float('-inf')  # never loaded
+_precision_lock = asyncio.Lock()
+
+
+class PriceMap(dict):
+    """
+    Dictionary of {symbol: price} that stores raw floats.
+
+    Tickers are stored as-is and converted to Decimal only when a price
+    is actually read, so batch requests don't pay Decimal parsing for
+    symbols the caller never looks at.
+    """
+
+    def __getitem__(self, symbol: str) -> Decimal:
+        return parse_decimal(super().__getitem__(symbol))
+
+    def get(self, symbol: str, default=None):
+        if symbol in self:
+            return self[symbol]
+        return default
+
+    def items(self):
+        return ((symbol, self[symbol]) for symbol in self)
+
+    def values(self):
+        return (self[symbol] for symbol in self)
+
+
+def _cache_ticker(symbol: str, ticker: dict):
+    """Store ticker's last price in price cache."""
+    price = ticker.get('last') or ticker.get('close')
+    if price:
+        price_cache.set(f"price:{symbol}", parse_decimal(price))
+
+
+async def _run_price_stream(symbols: List[str]):
+    """
+    Keep price_cache updated from MEXC WebSocket tickers.
+
+    Uses watch_tickers when MEXC supports it, otherwise one watch_ticker
+    loop per symbol (subscriptions share the same WebSocket connection).
+    """
+    ws = ccxtpro.mexc({'enableRateLimit': True})
+
+    async def watch_all():
+        while True:
+            try:
+                tickers = await ws.watch_tickers(symbols)
+                for symbol, ticker in tickers.items():
+                    _cache_ticker(symbol, ticker)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Price stream error: {e}. Reconnecting in 5s...")
+                await asyncio.sleep(5)
+
+    async def watch_one(symbol: str):
+        while True:
+            try:
+                _cache_ticker(symbol, await ws.watch_ticker(symbol))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Price stream error for {symbol}: {e}. Reconnecting in 5s...")
+                await asyncio.sleep(5)
+
+    try:
+        if ws.has.get('watchTickers'):
+            await watch_all()
+        else:
+            await asyncio.gather(*(watch_one(symbol) for symbol in symbols))
+    finally:
+        await ws.close()
+
+
 class MEXCService:
     """Service for interacting with MEXC exchange via CCXT."""
 
-    def __init__(self, db: AsyncSession):
-        """Initialize MEXC service."""
+    def __init__(self, db: AsyncSession, db_factory=None):
+        """
+        Initialize MEXC service.
+
+        Args:
+            db: DB session
+            db_factory: Function to create new DB session (optional). Pass it
+                when the service is shared by concurrent tasks (OrderMonitor),
+                since one AsyncSession can't run concurrent queries
+        """
         self.db = db
-        self._exchanges: Dict[int, ccxt.mexc] = {}  # Cache exchanges per user
+        self.db_factory = db_factory
+
+    async def _call(self, func, *args, **kwargs):
+        """
+        Call exchange method with retries, throttled by the request semaphore.
+
+        Every attempt waits for a global pacing slot; the semaphore is held
+        per attempt only, so backoff sleeps don't block other requests. A
+        rate-limit response with Retry-After pauses all requests that long.
+
+        Args:
+            func: Async exchange method
+            *args: Method arguments
+            **kwargs: Method keyword arguments and retry_async() options
+
+        Returns:
+            Method result
+        """
+        async def limited(*call_args, **call_kwargs):
+            await _pace()
+            try:
+                async with _request_semaphore:
+                    return await func(*call_args, **call_kwargs)
+            except ccxt.DDoSProtection:
+                _defer_requests(getattr(func, '__self__', None))
+                raise
+
+        limited.__name__ = func.__name__
+        return await retry_async(limited, *args, **kwargs)
+
+    async def _get_encrypted_keys(self, user_id: int) -> tuple[str, str]:
+        """
+        Load user's encrypted API credentials.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Tuple of (encrypted_api_key, encrypted_api_secret)
+
+        Raises:
+            MEXCError: If user has no API keys configured
+        """
+        # Load user's encrypted API keys from database
+        if self.db_factory is not None:
+            async with self.db_factory() as db:
+                result = await db.execute(_USER_KEYS_STMT, {'uid': user_id})
+                row = result.one_or_none()
+        else:
+            result = await self.db.execute(_USER_KEYS_STMT, {'uid': user_id})
+            row = result.one_or_none()
+
+        if not row or not row.mexc_api_key or not row.mexc_api_secret:
+            raise MEXCError("API ключи не настроены. Используйте /settings для настройки.")
+
+        return row.mexc_api_key, row.mexc_api_secret
+
+    async def _get_credentials(self, user_id: int) -> tuple[str, str]:
+        """
+        Load and decrypt user's API credentials.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Tuple of (api_key, api_secret)
+
+        Raises:
+            MEXCError: If user has no API keys configured
+        """
+        return security.decrypt_api_credentials(*await self._get_encrypted_keys(user_id))
 
     async def _get_exchange(self, user_id: int) -> ccxt.mexc:
         """
         Get or create MEXC exchange instance for user.
-        Note: Caller must close the exchange after use with await exchange.close()
+
+        The instance is shared by all callers for this user and must not be
+        closed by them. When it's replaced (keys changed), evicted or
+        cleared, it's closed after _EXCHANGE_CLOSE_GRACE_SECONDS so calls
+        still using it can finish; close_all() closes everything at once.
 
         Args:
             user_id: User ID
@@ -42,31 +495,36 @@ class MEXCService:
         Raises:
             MEXCError: If user has no API keys configured
         """
-        # Load user from database
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        # Cached instance is matched on the encrypted keys, so keys are
+        # only decrypted when a new instance is built
+        encrypted_keys = await self._get_encrypted_keys(user_id)
+
+        stale = None
+        cached = _user_exchanges.get(user_id)
+        if cached is not None and cached[0] == encrypted_keys:
+            exchange = cached[1]
+        else:
+            # No instance yet, or keys were changed in /settings
+            stale = cached[1] if cached is not None else None
+            api_key, api_secret = security.decrypt_api_credentials(*encrypted_keys)
 
-        if not user or not user.has_api_keys:
-            raise MEXCError("API ключи не настроены. Используйте /settings для настройки.")
+            # Create exchange instance
+            exchange = _create_exchange({
+                'apiKey': api_key,
+                'secret': api_secret,
+                'enableRateLimit': True,
+                'options': {
+                    'defaultType': 'spot',  # Only spot trading
+                    'createMarketBuyOrderRequiresPrice': False,  # For MEXC market buy orders
+                }
+            })
 
-        # Decrypt API keys
-        api_key, api_secret = security.decrypt_api_credentials(
-            user.mexc_api_key,
-            user.mexc_api_secret
-        )
+        _user_exchanges[user_id] = (encrypted_keys, exchange, time.monotonic())
+        _user_exchanges.move_to_end(user_id)
 
-        # Create exchange instance
-        exchange = ccxt.mexc({
-            'apiKey': api_key,
-            'secret': api_secret,
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'spot',  # Only spot trading
-                'createMarketBuyOrderRequiresPrice': False,  # For MEXC market buy orders
-            }
-        })
+        if stale is not None:
+            _close_later(stale)
+        _evict_user_exchanges()
 
         return exchange
 
@@ -86,18 +544,19 @@ class MEXCService:
                 'error': str (if any)
             }
         """
-        exchange = None
         try:
-            # Create temporary exchange instance
-            exchange = ccxt.mexc({
-                'apiKey': api_key,
-                'secret': api_secret,
-                'enableRateLimit': True,
-                'options': {'defaultType': 'spot'}
-            })
-
-            # Try to fetch balance
-            balance = await exchange.fetch_balance()
+            # Reuse long-lived probe exchange with keys swapped in for the test
+            async with _probe_lock:
+                probe = _get_probe_exchange()
+                probe.apiKey = api_key
+                probe.secret = api_secret
+                try:
+                    # Try to fetch balance
+                    async with _request_semaphore:
+                        balance = await probe.fetch_balance()
+                finally:
+                    probe.apiKey = ''
+                    probe.secret = ''
 
             return {
                 'valid': True,
@@ -133,11 +592,6 @@ class MEXCService:
                 'error': f'Ошибка: {str(e)}'
             }
 
-        finally:
-            # Always close the exchange connection
-            if exchange:
-                await exchange.close()
-
     async def get_balance(self, user_id: int, use_cache: bool = True) -> Dict[str, Decimal]:
         """
         Get user balance from MEXC.
@@ -152,22 +606,32 @@ class MEXCService:
         Raises:
             MEXCError: If API call fails
         """
-        # Check cache first (if enabled)
-        if use_cache:
+        # Check cache first (if enabled). Cached balance stays valid until
+        # the user places or cancels an order (see _balance_dirty)
+        if use_cache and user_id not in _balance_dirty:
             cache_key = f"balance:{user_id}"
-            cached_balance = price_cache.get(cache_key)
+            cached_balance = balance_cache.get(cache_key)
             if cached_balance is not None:
-                logger.debug(f"Balance cache HIT for user {user_id}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Balance cache HIT for user {user_id}")
                 return cached_balance
 
-        exchange = None
+        # Clear the dirty mark before fetching, dropping the stale entry so
+        # a failed fetch cannot bring it back. An order placed while the
+        # fetch is in flight marks the user dirty again, and then the
+        # (possibly stale) result is not cached
+        if use_cache and user_id in _balance_dirty:
+            _balance_dirty.discard(user_id)
+            balance_cache.remove(f"balance:{user_id}")
+
         try:
             exchange = await self._get_exchange(user_id)
 
-            balance_data = await retry_async(
+            balance_data = await self._call(
                 exchange.fetch_balance,
                 max_retries=3,
-                exceptions=(ccxt.NetworkError,)
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
             )
 
             # Extract non-zero balances
@@ -176,25 +640,21 @@ class MEXCService:
                 if amount and amount > 0:
                     balances[currency] = parse_decimal(amount)
 
-            # Cache balance for 30 seconds (balances change less frequently)
-            if use_cache:
-                price_cache.set(f"balance:{user_id}", balances)
-                logger.debug(f"Cached balance for user {user_id}")
+            if use_cache and user_id not in _balance_dirty:
+                balance_cache.set(f"balance:{user_id}", balances)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cached balance for user {user_id}")
 
             return balances
 
         except ccxt.AuthenticationError as e:
             logger.error(f"Authentication error getting balance: {e}")
-            raise MEXCError("Неверные API ключи")
+            raise MEXCAuthError("Неверные API ключи")
 
         except Exception as e:
             logger.error(f"Error getting balance: {e}")
             raise MEXCError(f"Ошибка получения баланса: {str(e)}")
 
-        finally:
-            if exchange:
-                await exchange.close()
-
     async def get_current_price(self, symbol: str, use_cache: bool = True) -> Decimal:
         """
         Get current price for trading pair.
@@ -219,13 +679,14 @@ class MEXCService:
         exchange = None
         try:
             # Use public API (no auth needed)
-            exchange = ccxt.mexc({'enableRateLimit': True})
+            exchange = _create_exchange({'enableRateLimit': True})
 
-            ticker = await retry_async(
+            ticker = await self._call(
                 exchange.fetch_ticker,
                 symbol,
                 max_retries=3,
-                exceptions=(ccxt.NetworkError,)
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
             )
 
             price = ticker.get('last') or ticker.get('close')
@@ -252,7 +713,7 @@ class MEXCService:
             if exchange:
                 await exchange.close()
 
-    async def get_multiple_prices(self, symbols: List[str]) -> dict:
+    async def get_multiple_prices(self, symbols: List[str]) -> PriceMap:
         """
         Get current prices for multiple trading pairs in one request.
         Much faster than calling get_current_price() for each symbol.
@@ -261,7 +722,7 @@ class MEXCService:
             symbols: List of trading pairs (e.g., ['BTC/USDT', 'ETH/USDT'])
 
         Returns:
-            Dictionary of {symbol: price}
+            PriceMap of {symbol: price} (prices are Decimal on access)
 
         Raises:
             MEXCError: If API call fails
@@ -269,31 +730,32 @@ class MEXCService:
         exchange = None
         try:
             # Use public API (no auth needed)
-            exchange = ccxt.mexc({'enableRateLimit': True})
+            exchange = _create_exchange({'enableRateLimit': True})
 
             # Fetch all tickers at once (one API call!)
-            tickers = await retry_async(
+            tickers = await self._call(
                 exchange.fetch_tickers,
                 symbols,
                 max_retries=3,
-                exceptions=(ccxt.NetworkError,)
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
             )
 
-            # Extract prices
-            prices = {}
+            # Extract prices (kept as floats, converted to Decimal on access)
+            prices = PriceMap()
             for symbol in symbols:
                 if symbol in tickers:
                     ticker = tickers[symbol]
                     price = ticker.get('last') or ticker.get('close')
                     if price:
-                        prices[symbol] = parse_decimal(price)
+                        prices[symbol] = float(price)
 
             return prices
 
         except Exception as e:
             logger.error(f"Error getting multiple prices: {e}")
-            # Return empty dict, let caller handle missing prices
-            return {}
+            # Return empty map, let caller handle missing prices
+            return PriceMap()
 
         finally:
             if exchange:
@@ -318,40 +780,87 @@ class MEXCService:
         Raises:
             MEXCError: If API call fails
         """
-        exchange = None
-        try:
-            exchange = ccxt.mexc({'enableRateLimit': True})
-
-            await exchange.load_markets()
+        spec = _precision_table.get(symbol)
+        if not self._precision_reload_due(spec):
+            return self._precision_lookup(symbol, spec)
 
-            if symbol not in exchange.markets:
-                raise MEXCError(f"Торговая пара {symbol} не найдена на MEXC")
+        async with _precision_lock:
+            # Another caller may have reloaded the table while we waited
+            spec = _precision_table.get(symbol)
+            if not self._precision_reload_due(spec):
+                return self._precision_lookup(symbol, spec)
 
-            market = exchange.markets[symbol]
+            try:
+                await self._load_precision_table(symbol)
 
-            return {
-                'min_order_amount': parse_decimal(market['limits']['amount']['min']),
-                'min_order_cost': parse_decimal(market['limits']['cost']['min']),
-                'price_precision': market.get('precision', {}).get('price', 8),
-                'amount_precision': market.get('precision', {}).get('amount', 8),
-                'limits': market['limits'],
-                'active': market.get('active', True),
-                'symbol': symbol,
-                'base': market['base'],
-                'quote': market['quote'],
-            }
+            except Exception as e:
+                if spec is not None:
+                    logger.warning(f"Failed to refresh trading rules, using cached ones for {symbol}: {e}")
+                    return spec.as_dict()
+
+                logger.error(f"Error getting exchange info for {symbol}: {e}")
+                raise MEXCError(f"Ошибка получения информации о паре: {str(e)}")
+
+        return self._precision_lookup(symbol, _precision_table.get(symbol))
+
+    @staticmethod
+    def _precision_reload_due(spec: Optional[PrecisionSpec]) -> bool:
+        """Check whether trading rules must be reloaded for a lookup."""
+        age = time.monotonic() - _precision_loaded_at
+        if spec is None:
+            return age >= _PRECISION_MISS_RELOAD_INTERVAL
+        return age >= _PRECISION_TABLE_TTL
+
+    @staticmethod
+    def _precision_lookup(symbol: str, spec: Optional[PrecisionSpec]) -> dict:
+        """Return trading rules of symbol, raising MEXCError if not listed."""
+        if spec is None:
+            raise MEXCError(f"Торговая пара {symbol} не найдена на MEXC")
+        return spec.as_dict()
+
+    async def _load_precision_table(self, symbol: str):
+        """
+        Reload trading rules of all markets.
 
-        except MEXCError:
-            # Re-raise MEXCError without wrapping
-            raise
+        Args:
+            symbol: Symbol being looked up (for debug logging)
+        """
+        global _precision_loaded_at
 
-        except Exception as e:
-            logger.error(f"Error getting exchange info for {symbol}: {e}")
-            raise MEXCError(f"Ошибка получения информации о паре: {str(e)}")
+        exchange = _create_exchange({'enableRateLimit': True})
+        try:
+            async with _request_semaphore:
+                await exchange.load_markets()
+
+            # Build lookup table for all markets in one pass, so subsequent
+            # calls (for any symbol) are plain dict lookups
+            debug = logger.isEnabledFor(logging.DEBUG)
+            table: Dict[str, PrecisionSpec] = {}
+            for market_symbol, market in exchange.markets.items():
+                try:
+                    table[market_symbol] = PrecisionSpec.from_market(market_symbol, market)
+                except (KeyError, TypeError) as e:
+                    if debug:
+                        logger.debug(f"Skipping market {market_symbol}: {e}")
+
+            if debug and symbol in exchange.markets:
+                market = exchange.markets[symbol]
+                logger.debug(
+                    f"[MEXC MARKET INFO] {symbol}: "
+                    f"precision={market.get('precision')}, "
+                    f"limits={market.get('limits')}, "
+                    f"info_keys={list(market.get('info', {}).keys())}"
+                )
+
+            # Replace (not merge), so delisted markets drop out
+            _precision_table.clear()
+            _precision_table.update(table)
+            _precision_loaded_at = time.monotonic()
+
+            logger.info(f"Loaded trading rules for {len(_precision_table)} MEXC markets")
 
         finally:
-            if exchange:
-                await exchange.close()
+            await exchange.close()
 
     async def create_limit_order(
         self,
@@ -384,36 +893,38 @@ class MEXCService:
         Raises:
             MEXCError: If order creation fails
         """
-        exchange = None
         try:
             exchange = await self._get_exchange(user_id)
 
-            order = await retry_async(
+            order = await self._call(
                 exchange.create_limit_order,
                 symbol,
                 side,
                 float(amount),
                 float(price),
                 max_retries=2,
-                exceptions=(ccxt.NetworkError,)
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
             )
 
             if not order:
                 raise MEXCError("Exchange returned empty response")
 
+            _balance_dirty.add(user_id)
+
             # Handle fee field safely (can be None or dict)
             fee_data = order.get('fee') or {}
 
             return {
                 'order_id': str(order['id']),
                 'status': order['status'],
-                'filled': parse_decimal(order.get('filled', 0)),
-                'remaining': parse_decimal(order.get('remaining', amount)),
-                'fee': parse_decimal(fee_data.get('cost', 0)),
+                'filled': fast_decimal(order.get('filled', 0)),
+                'remaining': fast_decimal(order.get('remaining', amount)),
+                'fee': fast_decimal(fee_data.get('cost', 0)),
                 'fee_currency': fee_data.get('currency', 'USDT'),
                 'timestamp': order.get('timestamp'),
-                'price': parse_decimal(order.get('price', price)),
-                'amount': parse_decimal(order.get('amount', amount)),
+                'price': fast_decimal(order.get('price', price)),
+                'amount': fast_decimal(order.get('amount', amount)),
             }
 
         except ccxt.InsufficientFunds as e:
@@ -426,16 +937,12 @@ class MEXCService:
 
         except ccxt.AuthenticationError as e:
             logger.error(f"Authentication error creating order: {e}")
-            raise MEXCError("Ошибка аутентификации. Проверьте API ключи.")
+            raise MEXCAuthError("Ошибка аутентификации. Проверьте API ключи.")
 
         except Exception as e:
             logger.error(f"Error creating limit order: {e}")
             raise MEXCError(f"Ошибка создания ордера: {str(e)}")
 
-        finally:
-            if exchange:
-                await exchange.close()
-
     async def create_market_order(
         self,
         user_id: int,
@@ -460,7 +967,6 @@ class MEXCService:
         Raises:
             MEXCError: If order creation fails
         """
-        exchange = None
         try:
             exchange = await self._get_exchange(user_id)
 
@@ -468,30 +974,33 @@ class MEXCService:
             # when createMarketBuyOrderRequiresPrice is False
             order_amount = float(amount)
 
-            order = await retry_async(
+            order = await self._call(
                 exchange.create_market_order,
                 symbol,
                 side,
                 order_amount,
                 max_retries=2,
-                exceptions=(ccxt.NetworkError,)
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
             )
 
             if not order or not isinstance(order, dict):
                 raise MEXCError("Exchange returned invalid response")
 
+            _balance_dirty.add(user_id)
+
             # Handle fee field safely (can be None or dict)
             fee_data = order.get('fee') or {}
 
             return {
                 'order_id': str(order['id']),
                 'status': order['status'],
-                'filled': parse_decimal(order.get('filled', 0)),
-                'average_price': parse_decimal(order.get('average', 0)),
-                'fee': parse_decimal(fee_data.get('cost', 0)),
+                'filled': fast_decimal(order.get('filled', 0)),
+                'average_price': fast_decimal(order.get('average', 0)),
+                'fee': fast_decimal(fee_data.get('cost', 0)),
                 'fee_currency': fee_data.get('currency', 'USDT'),
                 'timestamp': order.get('timestamp'),
-                'amount': parse_decimal(order.get('amount', amount)),
+                'amount': fast_decimal(order.get('amount', amount)),
             }
 
         except ccxt.InsufficientFunds as e:
@@ -506,10 +1015,6 @@ class MEXCService:
             logger.error(f"Error creating market order: {e}")
             raise MEXCError(f"Ошибка создания рыночного ордера: {str(e)}")
 
-        finally:
-            if exchange:
-                await exchange.close()
-
     async def cancel_order(self, user_id: int, symbol: str, order_id: str) -> bool:
         """
         Cancel order on MEXC.
@@ -525,18 +1030,20 @@ class MEXCService:
         Raises:
             MEXCError: If cancellation fails
         """
-        exchange = None
         try:
             exchange = await self._get_exchange(user_id)
 
-            await retry_async(
+            await self._call(
                 exchange.cancel_order,
                 order_id,
                 symbol,
                 max_retries=2,
-                exceptions=(ccxt.NetworkError,)
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
             )
 
+            _balance_dirty.add(user_id)
+
             logger.info(f"Cancelled order {order_id} for {symbol}")
             return True
 
@@ -548,9 +1055,70 @@ class MEXCService:
             logger.error(f"Error cancelling order {order_id}: {e}")
             raise MEXCError(f"Ошибка отмены ордера: {str(e)}")
 
-        finally:
-            if exchange:
-                await exchange.close()
+    async def cancel_orders_batch(
+        self,
+        user_id: int,
+        orders: List[Tuple[str, str]]
+    ) -> Dict[str, bool]:
+        """
+        Cancel many orders using one exchange connection.
+
+        Orders are cancelled concurrently (max 10 in flight); CCXT has no
+        spot batch cancel for MEXC.
+
+        Args:
+            user_id: User ID
+            orders: List of (symbol, order_id) pairs
+
+        Returns:
+            Dictionary of {order_id: cancelled}. Orders not found on exchange
+            count as cancelled.
+
+        Raises:
+            MEXCError: If exchange can't be created (e.g. no API keys)
+        """
+        results: Dict[str, bool] = {}
+        if not orders:
+            return results
+
+        try:
+            exchange = await self._get_exchange(user_id)
+
+            semaphore = asyncio.Semaphore(_CANCEL_CONCURRENCY)
+
+            async def cancel_one(symbol: str, order_id: str):
+                async with semaphore:
+                    try:
+                        await self._call(
+                            exchange.cancel_order,
+                            order_id,
+                            symbol,
+                            max_retries=2,
+                            exceptions=(ccxt.NetworkError,),
+                            backoff_policy=_BACKOFF_POLICY
+                        )
+                        results[order_id] = True
+                    except ccxt.OrderNotFound:
+                        results[order_id] = True  # Already cancelled or doesn't exist
+                    except Exception as e:
+                        logger.warning(f"Failed to cancel order {order_id}: {e}")
+                        results[order_id] = False
+
+            await asyncio.gather(*(cancel_one(symbol, order_id) for symbol, order_id in orders))
+
+            _balance_dirty.add(user_id)
+
+            logger.info(
+                f"Cancelled {sum(results.values())}/{len(orders)} orders for user {user_id}"
+            )
+            return results
+
+        except MEXCError:
+            raise
+
+        except Exception as e:
+            logger.error(f"Error cancelling orders: {e}")
+            raise MEXCError(f"Ошибка отмены ордеров: {str(e)}")
 
     async def get_order_status(self, user_id: int, symbol: str, order_id: str) -> dict:
         """
@@ -570,30 +1138,20 @@ class MEXCService:
         try:
             exchange = await self._get_exchange(user_id)
 
-            order = await retry_async(
+            order = await self._call(
                 exchange.fetch_order,
                 order_id,
                 symbol,
                 max_retries=3,
-                exceptions=(ccxt.NetworkError,)
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
             )
 
-            # Handle fee field safely (can be None or dict)
-            fee_data = order.get('fee') or {}
+            # Fills change balance without us placing anything
+            if order['status'] != 'open':
+                _balance_dirty.add(user_id)
 
-            return {
-                'order_id': str(order['id']),
-                'status': order['status'],
-                'side': order['side'],
-                'price': parse_decimal(order.get('price', 0)),
-                'amount': parse_decimal(order.get('amount', 0)),
-                'filled': parse_decimal(order.get('filled', 0)),
-                'remaining': parse_decimal(order.get('remaining', 0)),
-                'fee': parse_decimal(fee_data.get('cost', 0)),
-                'fee_currency': fee_data.get('currency'),
-                'timestamp': order.get('timestamp'),
-                'average_price': parse_decimal(order.get('average', 0)),
-            }
+            return _format_order_status(order)
 
         except ccxt.OrderNotFound as e:
             logger.error(f"Order {order_id} not found: {e}")
@@ -603,6 +1161,129 @@ class MEXCService:
             logger.error(f"Error getting order status: {e}")
             raise MEXCError(f"Ошибка получения статуса ордера: {str(e)}")
 
+    async def get_orders_by_ids(
+        self,
+        user_id: int,
+        symbol: str,
+        order_ids: List[str]
+    ) -> Dict[str, dict]:
+        """
+        Get status of many orders of one trading pair.
+
+        MEXC has no "orders by IDs" endpoint, so this makes one
+        fetch_open_orders request and only fetches individually the orders
+        that are no longer open (filled or cancelled since the last check).
+
+        Args:
+            user_id: User ID
+            symbol: Trading pair
+            order_ids: Exchange order IDs
+
+        Returns:
+            Dictionary of {order_id: order status dict} (format of
+            get_order_status()). Orders not found on exchange are omitted.
+
+        Raises:
+            MEXCError: If API call fails
+        """
+        if not order_ids:
+            return {}
+
+        try:
+            exchange = await self._get_exchange(user_id)
+
+            open_orders = await self._call(
+                exchange.fetch_open_orders,
+                symbol,
+                max_retries=3,
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
+            )
+
+            wanted = set(order_ids)
+            statuses = {}
+            for order in open_orders:
+                if order and str(order['id']) in wanted:
+                    statuses[str(order['id'])] = _format_order_status(order)
+
+            fetch_semaphore = asyncio.Semaphore(_ORDER_FETCH_CONCURRENCY)
+
+            async def fetch_one(order_id: str):
+                try:
+                    async with fetch_semaphore:
+                        order = await self._call(
+                            exchange.fetch_order,
+                            order_id,
+                            symbol,
+                            max_retries=3,
+                            exceptions=(ccxt.NetworkError,),
+                            backoff_policy=_BACKOFF_POLICY
+                        )
+                    statuses[order_id] = _format_order_status(order)
+                except ccxt.OrderNotFound as e:
+                    logger.error(f"Order {order_id} not found: {e}")
+
+            closed_ids = [order_id for order_id in order_ids if order_id not in statuses]
+            if closed_ids:
+                await asyncio.gather(*(fetch_one(order_id) for order_id in closed_ids))
+                _balance_dirty.add(user_id)
+
+            return statuses
+
+        except ccxt.AuthenticationError as e:
+            logger.error(f"Authentication error getting orders: {e}")
+            raise MEXCAuthError("Ошибка аутентификации. Проверьте API ключи.")
+
+        except MEXCError:
+            raise
+
+        except Exception as e:
+            logger.error(f"Error getting orders status: {e}")
+            raise MEXCError(f"Ошибка получения статуса ордеров: {str(e)}")
+
+    async def subscribe_user_stream(self, user_id: int) -> AsyncIterator[dict]:
+        """
+        Stream user's order updates from MEXC private WebSocket.
+
+        Yields one dict per order update, in the same format as
+        get_order_status() plus 'symbol'. Runs until the consumer stops
+        iterating; connection errors are raised to the consumer.
+
+        Args:
+            user_id: User ID
+
+        Yields:
+            Order status dict
+
+        Raises:
+            MEXCError: If user has no API keys configured
+            MEXCAuthError: If MEXC rejects the keys
+        """
+        api_key, api_secret = await self._get_credentials(user_id)
+
+        ws = ccxtpro.mexc({
+            'apiKey': api_key,
+            'secret': api_secret,
+            'enableRateLimit': True,
+            'options': {'defaultType': 'spot'}
+        })
+
+        try:
+            while True:
+                orders = await ws.watch_orders()
+                for order in orders:
+                    if order['status'] != 'open':
+                        _balance_dirty.add(user_id)
+
+                    status = _format_order_status(order)
+                    status['symbol'] = order.get('symbol')
+                    yield status
+        except ccxt.AuthenticationError as e:
+            logger.error(f"Authentication error in order stream: {e}")
+            raise MEXCAuthError("Ошибка аутентификации. Проверьте API ключи.")
+        finally:
+            await ws.close()
+
     async def get_open_orders(self, user_id: int, symbol: Optional[str] = None) -> List[dict]:
         """
         Get all open orders for user.
@@ -617,58 +1298,148 @@ class MEXCService:
         Raises:
             MEXCError: If API call fails
         """
-        exchange = None
         try:
             exchange = await self._get_exchange(user_id)
 
-            orders = await retry_async(
+            orders = await self._call(
                 exchange.fetch_open_orders,
                 symbol,
                 max_retries=3,
-                exceptions=(ccxt.NetworkError,)
+                exceptions=(ccxt.NetworkError,),
+                backoff_policy=_BACKOFF_POLICY
             )
 
-            return [
-                {
-                    'order_id': str(order['id']),
-                    'symbol': order['symbol'],
-                    'status': order['status'],
-                    'side': order['side'],
-                    'price': parse_decimal(order.get('price', 0)),
-                    'amount': parse_decimal(order.get('amount', 0)),
-                    'filled': parse_decimal(order.get('filled', 0)),
-                    'remaining': parse_decimal(order.get('remaining', 0)),
-                    'timestamp': order.get('timestamp'),
-                }
-                for order in orders if order
-            ]
+            return _format_open_orders(orders)
 
         except Exception as e:
             logger.error(f"Error getting open orders: {e}")
             raise MEXCError(f"Ошибка получения открытых ордеров: {str(e)}")
 
-        finally:
-            if exchange:
-                await exchange.close()
+    async def get_open_orders_multi(self, user_id: int, symbols: List[str]) -> dict:
+        """
+        Get open orders for several trading pairs concurrently.
+
+        Args:
+            user_id: User ID
+            symbols: Trading pairs
+
+        Returns:
+            {
+                'orders': list (open orders of all symbols),
+                'errors': dict ({symbol: error message} for failed symbols)
+            }
+
+        Raises:
+            MEXCError: If exchange can't be created (e.g. no API keys)
+        """
+        try:
+            exchange = await self._get_exchange(user_id)
+
+            results = await asyncio.gather(*(
+                self._call(
+                    exchange.fetch_open_orders,
+                    symbol,
+                    max_retries=3,
+                    exceptions=(ccxt.NetworkError,),
+                    backoff_policy=_BACKOFF_POLICY
+                )
+                for symbol in symbols
+            ), return_exceptions=True)
+
+            orders = []
+            errors = {}
+            for symbol, result in zip(symbols, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error getting open orders for {symbol}: {result}")
+                    errors[symbol] = str(result)
+                else:
+                    orders.extend(_format_open_orders(result))
+
+            return {'orders': orders, 'errors': errors}
+
+        except MEXCError:
+            raise
+
+        except Exception as e:
+            logger.error(f"Error getting open orders: {e}")
+            raise MEXCError(f"Ошибка получения открытых ордеров: {str(e)}")
+
+    async def start_price_stream(self, symbols: List[str]):
+        """
+        Start streaming prices for symbols into the price cache.
+
+        While the stream is running get_current_price() is served from cache
+        without REST calls. Only one stream exists per process; calling again
+        with new symbols restarts it with the union of all symbols.
+
+        Args:
+            symbols: Trading pairs (e.g., ['BTC/USDT', 'ETH/USDT'])
+        """
+        global _price_stream_task
+
+        new_symbols = set(symbols) - _price_stream_symbols
+        if _price_stream_task and not _price_stream_task.done() and not new_symbols:
+            return
+
+        await self.stop_price_stream()
+
+        _price_stream_symbols.update(symbols)
+        _price_stream_task = asyncio.create_task(
+            _run_price_stream(sorted(_price_stream_symbols))
+        )
+        logger.info(f"Started price stream for {len(_price_stream_symbols)} symbols")
+
+    async def stop_price_stream(self):
+        """Stop WebSocket price stream (if running)."""
+        global _price_stream_task
+
+        if _price_stream_task is None:
+            return
+
+        _price_stream_task.cancel()
+        try:
+            await _price_stream_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error stopping price stream: {e}")
+
+        _price_stream_task = None
 
     async def close_all(self):
         """Close all exchange connections."""
-        for exchange in self._exchanges.values():
+        global _http_session, _probe_exchange
+
+        await self.stop_price_stream()
+
+        if _probe_exchange is not None:
             try:
-                await exchange.close()
+                await _probe_exchange.close()
             except Exception as e:
-                logger.error(f"Error closing exchange connection: {e}")
+                logger.error(f"Error closing probe exchange: {e}")
+            _probe_exchange = None
 
-        self._exchanges.clear()
+        await self.clear_cache()
+        await _close_pending()
 
-    def clear_cache(self, user_id: Optional[int] = None):
+        if _http_session is not None:
+            await _http_session.close()
+            _http_session = None
+
+    async def clear_cache(self, user_id: Optional[int] = None):
         """
-        Clear exchange cache.
+        Clear exchange cache. Removed exchanges are closed after the grace
+        period, so calls still using them can finish.
 
         Args:
             user_id: User ID to clear (all if None)
         """
         if user_id:
-            self._exchanges.pop(user_id, None)
+            cached = _user_exchanges.pop(user_id, None)
+            exchanges = [cached[1]] if cached is not None else []
         else:
-            self._exchanges.clear()
+            exchanges = [exchange for _, exchange, _ in _user_exchanges.values()]
+            _user_exchanges.clear()
+
+        for exchange in exchanges:
+            _close_later(exchange)
@@ -1,11 +1,17 @@
 """Notification service for sending messages to users."""
+import asyncio
+from collections import deque
+from functools import lru_cache
 from decimal import Decimal
-from typing import Optional, Dict
+from typing import Optional, Dict, Deque, Set, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 import logging
+import time
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
+from src.utils.cache import SimpleCache
 from src.utils.formatters import (
     format_price,
     format_amount,
@@ -17,18 +23,356 @@ from src.utils.formatters import (
 
 logger = logging.getLogger(__name__)
 
+# Telegram limits: ~30 messages/sec overall, ~1 message/sec per chat
+GLOBAL_MESSAGES_PER_SECOND = 30
+CHAT_MESSAGE_INTERVAL = 1.0
+SEND_MAX_ATTEMPTS = 3
+
+# Seconds a sent fill notification is remembered to drop duplicates
+DEDUP_TTL_SECONDS = 600
+
+# Default for missing stats values (Decimals are immutable, safe to share)
+_ZERO = Decimal('0')
+
+# Message templates (bound str.format of constant strings)
+BUY_FILLED_TMPL = (
+    "📊 Grid Bot #{bot_id}\n\n"
+    "✅ Buy ордер исполнен!\n\n"
+    "💰 Куплено: {amount}\n"
+    "💵 По цене: {price}\n"
+    "💳 Потрачено: {total}\n"
+).format
+SELL_FILLED_TMPL = (
+    "📊 Grid Bot #{bot_id}\n\n"
+    "✅ Sell ордер исполнен!\n\n"
+    "💰 Продано: {amount}\n"
+    "💵 По цене: {price}\n"
+    "💳 Получено: {total}\n"
+).format
+NEW_SELL_ORDER_TMPL = "\n➡️ Создан Sell ордер: {amount} по {price}\n".format
+NEW_BUY_ORDER_TMPL = "\n➡️ Создан Buy ордер: {amount} по {price}\n".format
+EXPECTED_PROFIT_TMPL = "\n🎯 Прибыль за цикл: ~{profit}".format
+CYCLE_PROFIT_TMPL = "\n🎉 Прибыль за цикл: {profit}\n".format
+
+PROFIT_MILESTONE_TMPL = (
+    "🎉 Grid Bot #{bot_id}\n\n"
+    "💰 Прибыль достигла {percent}!\n\n"
+    "Текущая прибыль: {profit} ({percent})\n\n"
+    "Так держать! 🚀"
+).format
+
+# Error type specific messages
+ERROR_TEMPLATES = {
+    'insufficient_funds': (
+        "⚠️ Grid Bot #{bot_id}\n\n"
+        "Недостаточно средств для создания ордера!\n\n"
+        "Пожалуйста, пополните баланс или остановите бота."
+    ).format,
+    'api_error': (
+        "⚠️ Grid Bot #{bot_id}\n\n"
+        "Ошибка API биржи!\n\n"
+        "{message}"
+    ).format,
+    'invalid_api_key': (
+        "🔴 Grid Bot #{bot_id}\n\n"
+        "API ключи невалидны!\n\n"
+        "Бот остановлен. Пожалуйста, обновите API ключи в настройках."
+    ).format,
+    'order_creation_failed': (
+        "⚠️ Grid Bot #{bot_id}\n\n"
+        "Не удалось создать ордер!\n\n"
+        "{message}"
+    ).format,
+}
+DEFAULT_ERROR_TMPL = "⚠️ Grid Bot #{bot_id}\n\nОшибка: {message}".format
+
+BOT_STARTED_TMPL = (
+    "🎉 Grid Bot #{bot_id} запущен!\n\n"
+    "📊 Активных ордеров: {total_orders}\n"
+    "💰 В работе: {investment}\n\n"
+    "🔔 Буду присылать уведомления о:\n"
+    "• Исполненных ордерах\n"
+    "• Заработанной прибыли\n"
+    "• Важных событиях"
+).format
+
+BOT_STOPPED_TMPL = (
+    "🔴 Grid Bot #{bot_id} остановлен\n\n"
+    "📊 Итоговая статистика:\n\n"
+    "💰 Общая прибыль: {profit}\n"
+    "📈 ROI: {roi}\n"
+    "🔄 Завершено циклов: {cycles}\n"
+    "❌ Отменено ордеров: {cancelled}\n"
+).format
+RUNTIME_TMPL = "⏱ Время работы: {runtime}\n".format
+
+DAILY_SUMMARY_HEADER_TMPL = (
+    "📊 Ежедневная сводка\n"
+    "📅 {date}\n\n"
+    "🤖 Активных ботов: {active}\n"
+    "💰 Прибыль за 24ч: {total}\n\n"
+    "Боты:\n"
+).format
+DAILY_SUMMARY_BOT_TMPL = "\n• Bot #{id}: {profit} ({cycles} циклов)".format
+
+
+# Inline keyboard layouts per notification kind: rows of (text, callback_data)
+KEYBOARD_LAYOUTS = {
+    'order_filled': (
+        ("📊 Посмотреть бота", "bot_details:{bot_id}"),
+    ),
+    'profit_milestone': (
+        ("📊 Посмотреть детали", "bot_details:{bot_id}"),
+    ),
+    'error': (
+        ("📊 Посмотреть бота", "bot_details:{bot_id}"),
+        ("⚙️ Настройки", "settings"),
+    ),
+    'bot_started': (
+        ("📊 Посмотреть статус", "bot_details:{bot_id}"),
+        ("🏠 В главное меню", "main_menu"),
+    ),
+    'bot_stopped': (
+        ("📊 Мои боты", "my_bots"),
+        ("🏠 В главное меню", "main_menu"),
+    ),
+    'daily_summary': (
+        ("📊 Посмотреть ботов", "my_bots"),
+    ),
+}
+
+
+@lru_cache(maxsize=2048)
+def _keyboard(kind: str, grid_bot_id: int = 0) -> InlineKeyboardMarkup:
+    """
+    Get inline keyboard for notification kind.
+
+    Markups are reused across sends (they're never mutated), which saves
+    pydantic validation of new models for every notification.
+    """
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(
+            text=text,
+            callback_data=callback_data.format(bot_id=grid_bot_id)
+        )]
+        for text, callback_data in KEYBOARD_LAYOUTS[kind]
+    ])
+
 
 class NotificationService:
-    """Service for sending notifications to users."""
+    """
+    Service for sending notifications to users.
+
+    notify_* methods only build the message and put it in a queue; a single
+    background dispatcher sends queued messages paced to Telegram rate
+    limits, so callers (e.g. OrderMonitor) never wait on Telegram.
+    """
 
-    def __init__(self, bot: Bot):
+    def __init__(self, bot: Bot, dedup_cache: Optional[SimpleCache] = None):
         """
         Initialize notification service.
 
         Args:
             bot: Aiogram Bot instance
+            dedup_cache: Cache of already notified fills (default: new
+                SimpleCache with DEDUP_TTL_SECONDS TTL)
         """
         self.bot = bot
+        self._dedup = dedup_cache or SimpleCache(ttl_seconds=DEDUP_TTL_SECONDS)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._sends: Set[asyncio.Task] = set()
+        self._sent_at: Deque[float] = deque()
+        # Per-chat state is kept only while the chat has deliveries in
+        # flight or was sent to within CHAT_MESSAGE_INTERVAL
+        self._chat_locks: Dict[int, asyncio.Lock] = {}
+        self._chat_pending: Dict[int, int] = {}
+        self._chat_last_sent: Dict[int, float] = {}
+
+    def _enqueue(
+        self,
+        chat_id: int,
+        text: str,
+        keyboard: InlineKeyboardMarkup,
+        kind: str,
+        on_done: Optional[Callable[[bool], Awaitable]] = None
+    ):
+        """
+        Queue message for delivery (starts dispatcher on first use).
+
+        on_done, if given, is awaited with True once Telegram accepted the
+        message, or with False if sending failed.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        self._queue.put_nowait((chat_id, text, keyboard, kind, on_done))
+
+    async def _run(self):
+        """Dispatch queued messages respecting global rate limit."""
+        while True:
+            item = await self._queue.get()
+
+            # Global limit: sliding 1-second window of send timestamps
+            while True:
+                now = time.monotonic()
+                while self._sent_at and now - self._sent_at[0] >= 1.0:
+                    self._sent_at.popleft()
+                if len(self._sent_at) < GLOBAL_MESSAGES_PER_SECOND:
+                    break
+                await asyncio.sleep(1.0 - (now - self._sent_at[0]))
+
+            self._sent_at.append(time.monotonic())
+
+            task = asyncio.create_task(self._deliver(*item))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+
+    async def _deliver(
+        self,
+        chat_id: int,
+        text: str,
+        keyboard: InlineKeyboardMarkup,
+        kind: str,
+        on_done: Optional[Callable[[bool], Awaitable]] = None
+    ):
+        """Send one message respecting per-chat limit, retrying on flood wait."""
+        lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+        self._chat_pending[chat_id] = self._chat_pending.get(chat_id, 0) + 1
+        sent = False
+
+        try:
+            async with lock:
+                wait = CHAT_MESSAGE_INTERVAL - (
+                    time.monotonic() - self._chat_last_sent.get(chat_id, 0.0)
+                )
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                for attempt in range(1, SEND_MAX_ATTEMPTS + 1):
+                    try:
+                        await self.bot.send_message(
+                            chat_id=chat_id,
+                            text=text,
+                            reply_markup=keyboard
+                        )
+                        break
+                    except TelegramRetryAfter as e:
+                        if attempt == SEND_MAX_ATTEMPTS:
+                            raise
+                        logger.warning("Telegram flood control, retrying in %ss", e.retry_after)
+                        await asyncio.sleep(e.retry_after)
+
+                self._chat_last_sent[chat_id] = time.monotonic()
+
+            sent = True
+            logger.info("Sent %s notification to user %s", kind, chat_id)
+
+        except Exception as e:
+            logger.error("Error sending %s notification: %s", kind, e)
+
+        finally:
+            self._release_chat(chat_id)
+            if on_done is not None:
+                try:
+                    await on_done(sent)
+                except Exception as e:
+                    logger.error("Error in %s notification callback: %s", kind, e)
+            self._queue.task_done()
+
+    def _release_chat(self, chat_id: int):
+        """Finish a delivery to chat_id and drop per-chat state nobody needs."""
+        self._chat_pending[chat_id] -= 1
+        if not self._chat_pending[chat_id]:
+            del self._chat_pending[chat_id]
+            del self._chat_locks[chat_id]
+
+        now = time.monotonic()
+        for idle_chat, sent_at in list(self._chat_last_sent.items()):
+            if idle_chat not in self._chat_pending and now - sent_at >= CHAT_MESSAGE_INTERVAL:
+                del self._chat_last_sent[idle_chat]
+
+    async def close(self):
+        """Wait for queued messages to be sent and stop dispatcher."""
+        if self._worker is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=10)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %s unsent notifications", self._queue.qsize())
+
+        self._worker.cancel()
+        self._worker = None
+
+    def _release_on_failure(
+        self,
+        key: str,
+        on_done: Callable[[bool], Awaitable]
+    ) -> Callable[[bool], Awaitable]:
+        """Wrap on_done to drop dedup key if sending fails, so a retry gets through."""
+        async def wrapped(sent: bool):
+            if not sent:
+                self._dedup.remove(key)
+            await on_done(sent)
+
+        return wrapped
+
+    def _build_order_filled(
+        self,
+        grid_bot_id: int,
+        order: dict,
+        new_order: Optional[dict] = None,
+        profit: Optional[Decimal] = None
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """Build filled order message and keyboard."""
+        side = order['side']
+        price = order['price']
+        amount = order['amount']
+
+        if side == 'buy':
+            # Buy order filled template
+            parts = [BUY_FILLED_TMPL(
+                bot_id=grid_bot_id,
+                amount=format_amount(amount),
+                price=format_price(price),
+                total=format_price(price * amount)
+            )]
+
+            if new_order:
+                parts.append(NEW_SELL_ORDER_TMPL(
+                    amount=format_amount(new_order['amount']),
+                    price=format_price(new_order['price'])
+                ))
+
+                # Calculate expected profit
+                if new_order.get('price') and order.get('price'):
+                    expected_profit = (new_order['price'] - order['price']) * order['amount']
+                    parts.append(EXPECTED_PROFIT_TMPL(profit=format_profit(expected_profit)))
+
+        else:  # sell
+            # Sell order filled template
+            parts = [SELL_FILLED_TMPL(
+                bot_id=grid_bot_id,
+                amount=format_amount(amount),
+                price=format_price(price),
+                total=format_price(price * amount)
+            )]
+
+            if new_order:
+                parts.append(NEW_BUY_ORDER_TMPL(
+                    amount=format_amount(new_order['amount']),
+                    price=format_price(new_order['price'])
+                ))
+
+            if profit is not None:
+                parts.append(CYCLE_PROFIT_TMPL(profit=format_profit(profit)))
+
+        message = "".join(parts)
+
+        keyboard = _keyboard('order_filled', grid_bot_id)
+
+        return message, keyboard
 
     async def notify_order_filled(
         self,
@@ -36,7 +380,8 @@ class NotificationService:
         grid_bot_id: int,
         order: dict,
         new_order: Optional[dict] = None,
-        profit: Optional[Decimal] = None
+        profit: Optional[Decimal] = None,
+        on_done: Optional[Callable[[bool], Awaitable]] = None
     ):
         """
         Notify user about filled order.
@@ -47,77 +392,55 @@ class NotificationService:
             order: Filled order details
             new_order: New counter order (optional)
             profit: Profit from cycle (optional, for sell orders)
+            on_done: Awaited with send result (optional, used by outbox)
         """
-        try:
-            side = order['side']
-            price = order['price']
-            amount = order['amount']
-
-            if side == 'buy':
-                # Buy order filled template
-                message = (
-                    f"📊 Grid Bot #{grid_bot_id}\n\n"
-                    f"✅ Buy ордер исполнен!\n\n"
-                    f"💰 Куплено: {format_amount(amount)}\n"
-                    f"💵 По цене: {format_price(price)}\n"
-                    f"💳 Потрачено: {format_price(price * amount)}\n"
-                )
-
-                if new_order:
-                    message += (
-                        f"\n➡️ Создан Sell ордер: {format_amount(new_order['amount'])} "
-                        f"по {format_price(new_order['price'])}\n"
-                    )
-
-                    # Calculate expected profit
-                    if new_order.get('price') and order.get('price'):
-                        expected_profit = (new_order['price'] - order['price']) * order['amount']
-                        message += f"\n🎯 Прибыль за цикл: ~{format_profit(expected_profit)}"
-
-            else:  # sell
-                # Sell order filled template
-                message = (
-                    f"📊 Grid Bot #{grid_bot_id}\n\n"
-                    f"✅ Sell ордер исполнен!\n\n"
-                    f"💰 Продано: {format_amount(amount)}\n"
-                    f"💵 По цене: {format_price(price)}\n"
-                    f"💳 Получено: {format_price(price * amount)}\n"
-                )
+        # Same fill may be reported twice (WebSocket stream and polling
+        # sweep, or two outbox events for one order); one message per order
+        key = f"nf:{grid_bot_id}:{order['id']}"
+        if self._dedup.get(key):
+            logger.info("Skipping duplicate order filled notification for order %s", order['id'])
+            if on_done is not None:
+                # Delivery is tracked by the event that got through
+                await on_done(True)
+            return
+        self._dedup.set(key, True)
+
+        if on_done is not None:
+            on_done = self._release_on_failure(key, on_done)
 
-                if new_order:
-                    message += (
-                        f"\n➡️ Создан Buy ордер: {format_amount(new_order['amount'])} "
-                        f"по {format_price(new_order['price'])}\n"
-                    )
-
-                if profit is not None:
-                    message += f"\n🎉 Прибыль за цикл: {format_profit(profit)}\n"
+        try:
+            message, keyboard = self._build_order_filled(grid_bot_id, order, new_order, profit)
+            self._enqueue(user_id, message, keyboard, 'order filled', on_done)
 
-            # Add inline keyboard
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="📊 Посмотреть бота",
-                    callback_data=f"bot_details:{grid_bot_id}"
-                )]
-            ])
+        except Exception as e:
+            logger.error("Error sending order filled notification: %s", e)
+            if on_done is not None:
+                await on_done(False)
 
-            await self.bot.send_message(
-                chat_id=user_id,
-                text=message,
-                reply_markup=keyboard
-            )
+    def _build_profit_milestone(
+        self,
+        grid_bot_id: int,
+        profit: Decimal,
+        percent: Decimal
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """Build profit milestone message and keyboard."""
+        message = PROFIT_MILESTONE_TMPL(
+            bot_id=grid_bot_id,
+            percent=format_percent(percent),
+            profit=format_profit(profit)
+        )
 
-            logger.info(f"Sent order filled notification to user {user_id}")
+        keyboard = _keyboard('profit_milestone', grid_bot_id)
 
-        except Exception as e:
-            logger.error(f"Error sending order filled notification: {e}")
+        return message, keyboard
 
     async def notify_profit_milestone(
         self,
         user_id: int,
         grid_bot_id: int,
         profit: Decimal,
-        percent: Decimal
+        percent: Decimal,
+        on_done: Optional[Callable[[bool], Awaitable]] = None
     ):
         """
         Notify user about profit milestone.
@@ -127,32 +450,30 @@ class NotificationService:
             grid_bot_id: Grid bot ID
             profit: Current profit
             percent: Profit percentage
+            on_done: Awaited with send result (optional)
         """
         try:
-            message = (
-                f"🎉 Grid Bot #{grid_bot_id}\n\n"
-                f"💰 Прибыль достигла {format_percent(percent)}!\n\n"
-                f"Текущая прибыль: {format_profit(profit)} ({format_percent(percent)})\n\n"
-                f"Так держать! 🚀"
-            )
-
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="📊 Посмотреть детали",
-                    callback_data=f"bot_details:{grid_bot_id}"
-                )]
-            ])
-
-            await self.bot.send_message(
-                chat_id=user_id,
-                text=message,
-                reply_markup=keyboard
-            )
-
-            logger.info(f"Sent profit milestone notification to user {user_id}")
+            message, keyboard = self._build_profit_milestone(grid_bot_id, profit, percent)
+            self._enqueue(user_id, message, keyboard, 'profit milestone', on_done)
 
         except Exception as e:
-            logger.error(f"Error sending profit milestone notification: {e}")
+            logger.error("Error sending profit milestone notification: %s", e)
+            if on_done is not None:
+                await on_done(False)
+
+    def _build_error(
+        self,
+        grid_bot_id: int,
+        error_type: str,
+        error_message: str
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """Build error message and keyboard."""
+        template = ERROR_TEMPLATES.get(error_type, DEFAULT_ERROR_TMPL)
+        message = template(bot_id=grid_bot_id, message=error_message)
+
+        keyboard = _keyboard('error', grid_bot_id)
+
+        return message, keyboard
 
     async def notify_error(
         self,
@@ -173,58 +494,30 @@ class NotificationService:
             details: Additional details (optional)
         """
         try:
-            # Error type specific messages
-            error_templates = {
-                'insufficient_funds': (
-                    "⚠️ Grid Bot #{bot_id}\n\n"
-                    "Недостаточно средств для создания ордера!\n\n"
-                    "Пожалуйста, пополните баланс или остановите бота."
-                ),
-                'api_error': (
-                    "⚠️ Grid Bot #{bot_id}\n\n"
-                    "Ошибка API биржи!\n\n"
-                    "{message}"
-                ),
-                'invalid_api_key': (
-                    "🔴 Grid Bot #{bot_id}\n\n"
-                    "API ключи невалидны!\n\n"
-                    "Бот остановлен. Пожалуйста, обновите API ключи в настройках."
-                ),
-                'order_creation_failed': (
-                    "⚠️ Grid Bot #{bot_id}\n\n"
-                    "Не удалось создать ордер!\n\n"
-                    "{message}"
-                ),
-            }
-
-            template = error_templates.get(
-                error_type,
-                "⚠️ Grid Bot #{bot_id}\n\nОшибка: {message}"
-            )
-
-            message = template.format(bot_id=grid_bot_id, message=error_message)
-
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="📊 Посмотреть бота",
-                    callback_data=f"bot_details:{grid_bot_id}"
-                )],
-                [InlineKeyboardButton(
-                    text="⚙️ Настройки",
-                    callback_data="settings"
-                )]
-            ])
-
-            await self.bot.send_message(
-                chat_id=user_id,
-                text=message,
-                reply_markup=keyboard
-            )
-
-            logger.info(f"Sent error notification to user {user_id}: {error_type}")
+            message, keyboard = self._build_error(grid_bot_id, error_type, error_message)
+            self._enqueue(user_id, message, keyboard, f"error ({error_type})")
 
         except Exception as e:
-            logger.error(f"Error sending error notification: {e}")
+            logger.error("Error sending error notification: %s", e)
+
+    def _build_bot_started(
+        self,
+        grid_bot_id: int,
+        stats: dict
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """Build bot started message and keyboard."""
+        total_orders = stats.get('total_orders', 0)
+        investment = stats.get('investment', _ZERO)
+
+        message = BOT_STARTED_TMPL(
+            bot_id=grid_bot_id,
+            total_orders=total_orders,
+            investment=format_price(investment)
+        )
+
+        keyboard = _keyboard('bot_started', grid_bot_id)
+
+        return message, keyboard
 
     async def notify_bot_started(
         self,
@@ -241,40 +534,38 @@ class NotificationService:
             stats: Bot statistics
         """
         try:
-            total_orders = stats.get('total_orders', 0)
-            investment = stats.get('investment', Decimal('0'))
-
-            message = (
-                f"🎉 Grid Bot #{grid_bot_id} запущен!\n\n"
-                f"📊 Активных ордеров: {total_orders}\n"
-                f"💰 В работе: {format_price(investment)}\n\n"
-                f"🔔 Буду присылать уведомления о:\n"
-                f"• Исполненных ордерах\n"
-                f"• Заработанной прибыли\n"
-                f"• Важных событиях"
-            )
-
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="📊 Посмотреть статус",
-                    callback_data=f"bot_details:{grid_bot_id}"
-                )],
-                [InlineKeyboardButton(
-                    text="🏠 В главное меню",
-                    callback_data="main_menu"
-                )]
-            ])
-
-            await self.bot.send_message(
-                chat_id=user_id,
-                text=message,
-                reply_markup=keyboard
-            )
-
-            logger.info(f"Sent bot started notification to user {user_id}")
+            message, keyboard = self._build_bot_started(grid_bot_id, stats)
+            self._enqueue(user_id, message, keyboard, 'bot started')
 
         except Exception as e:
-            logger.error(f"Error sending bot started notification: {e}")
+            logger.error("Error sending bot started notification: %s", e)
+
+    def _build_bot_stopped(
+        self,
+        grid_bot_id: int,
+        stats: dict
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """Build bot stopped message and keyboard."""
+        total_profit = stats.get('final_profit', _ZERO)
+        profit_percent = stats.get('profit_percent', _ZERO)
+        runtime = stats.get('runtime')
+        cycles = stats.get('total_cycles', 0)
+        cancelled_orders = stats.get('cancelled_orders', 0)
+
+        message = BOT_STOPPED_TMPL(
+            bot_id=grid_bot_id,
+            profit=format_profit(total_profit),
+            roi=format_percent(profit_percent),
+            cycles=cycles,
+            cancelled=cancelled_orders
+        )
+
+        if runtime:
+            message = message + RUNTIME_TMPL(runtime=format_runtime(None, runtime))
+
+        keyboard = _keyboard('bot_stopped')
+
+        return message, keyboard
 
     async def notify_bot_stopped(
         self,
@@ -291,45 +582,36 @@ class NotificationService:
             stats: Final statistics
         """
         try:
-            total_profit = stats.get('final_profit', Decimal('0'))
-            profit_percent = stats.get('profit_percent', Decimal('0'))
-            runtime = stats.get('runtime')
-            cycles = stats.get('total_cycles', 0)
-            cancelled_orders = stats.get('cancelled_orders', 0)
-
-            message = (
-                f"🔴 Grid Bot #{grid_bot_id} остановлен\n\n"
-                f"📊 Итоговая статистика:\n\n"
-                f"💰 Общая прибыль: {format_profit(total_profit)}\n"
-                f"📈 ROI: {format_percent(profit_percent)}\n"
-                f"🔄 Завершено циклов: {cycles}\n"
-                f"❌ Отменено ордеров: {cancelled_orders}\n"
-            )
-
-            if runtime:
-                message += f"⏱ Время работы: {format_runtime(None, runtime)}\n"
-
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="📊 Мои боты",
-                    callback_data="my_bots"
-                )],
-                [InlineKeyboardButton(
-                    text="🏠 В главное меню",
-                    callback_data="main_menu"
-                )]
-            ])
-
-            await self.bot.send_message(
-                chat_id=user_id,
-                text=message,
-                reply_markup=keyboard
-            )
-
-            logger.info(f"Sent bot stopped notification to user {user_id}")
+            message, keyboard = self._build_bot_stopped(grid_bot_id, stats)
+            self._enqueue(user_id, message, keyboard, 'bot stopped')
 
         except Exception as e:
-            logger.error(f"Error sending bot stopped notification: {e}")
+            logger.error("Error sending bot stopped notification: %s", e)
+
+    def _build_daily_summary(self, bots_stats: list) -> Tuple[str, InlineKeyboardMarkup]:
+        """Build daily summary message and keyboard."""
+        # Totals and per-bot lines in one pass
+        total_profit = _ZERO
+        active_bots = 0
+        lines = []
+        for bot in bots_stats:
+            total_profit += bot['profit']
+            active_bots += bot['status'] == 'active'
+            lines.append(DAILY_SUMMARY_BOT_TMPL(
+                id=bot['id'],
+                profit=format_profit(bot['profit']),
+                cycles=bot['cycles']
+            ))
+
+        message = DAILY_SUMMARY_HEADER_TMPL(
+            date=datetime.utcnow().strftime('%Y-%m-%d'),
+            active=active_bots,
+            total=format_profit(total_profit)
+        ) + "".join(lines)
+
+        keyboard = _keyboard('daily_summary')
+
+        return message, keyboard
 
     async def send_daily_summary(self, user_id: int, bots_stats: list):
         """
@@ -343,37 +625,8 @@ class NotificationService:
             if not bots_stats:
                 return
 
-            total_profit = sum(bot['profit'] for bot in bots_stats)
-            active_bots = len([b for b in bots_stats if b['status'] == 'active'])
-
-            message = (
-                f"📊 Ежедневная сводка\n"
-                f"📅 {datetime.utcnow().strftime('%Y-%m-%d')}\n\n"
-                f"🤖 Активных ботов: {active_bots}\n"
-                f"💰 Прибыль за 24ч: {format_profit(total_profit)}\n\n"
-                f"Боты:\n"
-            )
-
-            for bot in bots_stats:
-                message += (
-                    f"\n• Bot #{bot['id']}: {format_profit(bot['profit'])} "
-                    f"({bot['cycles']} циклов)"
-                )
-
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="📊 Посмотреть ботов",
-                    callback_data="my_bots"
-                )]
-            ])
-
-            await self.bot.send_message(
-                chat_id=user_id,
-                text=message,
-                reply_markup=keyboard
-            )
-
-            logger.info(f"Sent daily summary to user {user_id}")
+            message, keyboard = self._build_daily_summary(bots_stats)
+            self._enqueue(user_id, message, keyboard, 'daily summary')
 
         except Exception as e:
-            logger.error(f"Error sending daily summary: {e}")
+            logger.error("Error sending daily summary: %s", e)
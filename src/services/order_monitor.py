@@ -1,31 +1,60 @@
 """Order monitoring service."""
 import asyncio
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 from decimal import Decimal
 from datetime import datetime
 import logging
+import random
+import time
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, with_loader_criteria
 
 from src.models.grid_bot import GridBot
 from src.models.order import GridOrder
 from src.models.bot_log import BotLog
-from src.services.mexc_service import MEXCService, MEXCError
+from src.models.outbox_event import OutboxEvent
+from src.services.mexc_service import MEXCService, MEXCError, MEXCAuthError
 from src.services.grid_strategy import GridStrategy
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Max bots whose orders are checked on the exchange at the same time
+MAX_CONCURRENT_BOTS = 32
+
+# Total profit percents that trigger a milestone notification
+_MILESTONES = frozenset({5, 10, 15, 20, 25, 30, 50, 75, 100})
+_MILESTONE_DEC = {milestone: Decimal(milestone) for milestone in _MILESTONES}
+
+# Seconds between last_activity_at writes for bots without fills
+ACTIVITY_PERSIST_INTERVAL = 300
+
+
+def _backoff_delay(retry_delay: float, max_retry_delay: float) -> float:
+    """
+    Decorrelated jitter for retry sleeps.
+
+    Loops failing on the same MEXC/DB outage don't retry in lockstep.
+    """
+    return random.uniform(1.0, max(1.0, min(retry_delay * 3, max_retry_delay)))
+
 
 class OrderMonitor:
-    """Background order monitoring service."""
+    """
+    Background order monitoring service.
+
+    One task (run) checks all monitored bots per tick instead of one task
+    per bot, so DB load per tick doesn't grow with the number of bots.
+    """
 
     def __init__(
         self,
         db_factory,
         mexc_service: MEXCService,
         grid_strategy: GridStrategy,
-        notification_service
+        notification_service,
+        outbox=None
     ):
         """
         Initialize order monitor.
@@ -35,200 +64,409 @@ class OrderMonitor:
             mexc_service: MEXC service instance
             grid_strategy: Grid strategy instance
             notification_service: Notification service instance
+            outbox: OutboxDispatcher delivering fill notifications (optional,
+                notifications are sent directly without it)
         """
         self.db_factory = db_factory
         self.mexc = mexc_service
         self.grid_strategy = grid_strategy
         self.notification = notification_service
-        self.active_monitors: Dict[int, asyncio.Task] = {}
+        self.outbox = outbox
+        self.monitored_bots: Set[int] = set()
+        self._task: Optional[asyncio.Task] = None
         self.check_interval = settings.ORDER_CHECK_INTERVAL
 
-    async def monitor_bot_orders(self, grid_bot_id: int):
+        # Order fills are pushed over one WebSocket per user (shared by all
+        # user's bots); the polling loop is a slow reconciliation sweep
+        self.user_streams: Dict[int, asyncio.Task] = {}
+        self._bot_users: Dict[int, int] = {}
+        self._processing: Set[int] = set()
+        self._last_persist: Dict[int, float] = {}
+
+        # GridStrategy works on one long-lived DB session, which can't run
+        # concurrent operations; fills from streams and sweep take turns
+        self._strategy_lock = asyncio.Lock()
+
+    def _fill_notifications(self, bot: GridBot, order: GridOrder, fill: dict) -> list:
         """
-        Infinite loop monitoring orders for specific bot.
-
-        Algorithm (every 10 seconds):
-        1. Check if bot is still active (status = 'active')
-        2. Load open orders from DB (status = 'open')
-        3. For each order:
-           - Get status from exchange
-           - IF status == 'filled':
-               * Update in DB
-               * Call GridStrategy.handle_filled_order()
-        4. Update last_activity_at
+        Build notifications for processed fill.
 
-        Error handling:
-        - Network errors → retry with exponential backoff
-        - Invalid API key → stop bot, notify
-        - Insufficient funds → log, notify
-        - Critical error → stop monitoring, notify
+        Args:
+            bot: Grid bot
+            order: Filled order
+            fill: Result of GridStrategy.handle_filled_order()
 
-        Runs while:
-        - bot.status == 'active'
-        - No critical errors
+        Returns:
+            List of (kind, payload) pairs; kind is the notify_* method suffix
+            and OutboxDispatcher.HANDLERS key
+        """
+        notifications = [('order_filled', dict(
+            user_id=bot.user_id,
+            grid_bot_id=bot.id,
+            order={
+                'id': order.id,
+                'side': order.side,
+                'price': order.price,
+                'amount': order.amount,
+            },
+            new_order=fill.get('new_order'),
+            profit=fill.get('profit')
+        ))]
+
+        # Check for profit milestone
+        if fill.get('cycle_completed') and bot.total_profit_percent > 0:
+            # Check if we reached a milestone (5%, 10%, etc.);
+            # percent is positive here, so int() truncation is floor
+            current_milestone = int(bot.total_profit_percent) // 5 * 5
+
+            if current_milestone in _MILESTONES:
+                notifications.append(('profit_milestone', dict(
+                    user_id=bot.user_id,
+                    grid_bot_id=bot.id,
+                    profit=bot.total_profit,
+                    percent=_MILESTONE_DEC[current_milestone]
+                )))
+
+        return notifications
+
+    async def _process_filled_order(
+        self,
+        db: AsyncSession,
+        bot: GridBot,
+        order: GridOrder,
+        status: dict
+    ) -> bool:
+        """
+        Process order reported as filled by exchange.
+
+        Shared by polling loop and WebSocket consumer; skips orders that are
+        already being processed or are no longer open.
 
         Args:
-            grid_bot_id: Grid bot ID
+            db: DB session that loaded bot and order
+            bot: Grid bot
+            order: Filled order
+            status: Order status from exchange
+
+        Returns:
+            True if the fill was processed by this call
         """
-        logger.info(f"Starting monitoring for bot {grid_bot_id}")
+        if order.id in self._processing:
+            return False
+
+        self._processing.add(order.id)
+        try:
+            await db.refresh(order)
+            if order.status != 'open':
+                return False
+
+            logger.info(
+                "Order %s filled: %s %s @ %s",
+                order.id, order.side, order.amount, order.price
+            )
+
+            # Update fee if available
+            if status.get('fee'):
+                order.fee = status['fee']
+                order.fee_currency = status.get('fee_currency')
+
+            # Handle filled order. With an outbox, notifications are written
+            # as events in the same transaction as the order update
+            if self.outbox is not None:
+                async with self._strategy_lock:
+                    await self.grid_strategy.handle_filled_order(
+                        order.id,
+                        outbox_events=lambda fill: [
+                            OutboxEvent.create(kind, payload)
+                            for kind, payload in self._fill_notifications(bot, order, fill)
+                        ]
+                    )
+                self.outbox.wake()
+
+            else:
+                async with self._strategy_lock:
+                    fill = await self.grid_strategy.handle_filled_order(order.id)
+                if self.notification:
+                    for kind, payload in self._fill_notifications(bot, order, fill):
+                        await getattr(self.notification, f"notify_{kind}")(**payload)
+
+            return True
+
+        finally:
+            self._processing.discard(order.id)
+
+    async def _consume_ws(self, user_id: int):
+        """
+        Process order fills pushed by MEXC user WebSocket stream.
+
+        Reconnects with exponential backoff on errors; stops when user has no
+        API keys or the task is cancelled.
+
+        Args:
+            user_id: User ID
+        """
+        logger.info("Starting order stream for user %s", user_id)
 
         retry_delay = 1.0
         max_retry_delay = 60.0
 
         while True:
             try:
-                # Create new DB session for each iteration
-                async with self.db_factory() as db:
-                    # Load bot
-                    result = await db.execute(
-                        select(GridBot).where(GridBot.id == grid_bot_id)
-                    )
-                    bot = result.scalar_one_or_none()
+                async for status in self.mexc.subscribe_user_stream(user_id):
+                    retry_delay = 1.0
 
-                    if not bot:
-                        logger.warning(f"Bot {grid_bot_id} not found, stopping monitoring")
-                        break
+                    if status['status'] != 'filled':
+                        continue
 
-                    if bot.status != 'active':
-                        logger.info(f"Bot {grid_bot_id} is not active, stopping monitoring")
-                        break
+                    async with self.db_factory() as db:
+                        result = await db.execute(
+                            select(GridOrder).where(
+                                GridOrder.exchange_order_id == status['order_id'],
+                                GridOrder.status == 'open'
+                            )
+                        )
+                        order = result.scalar_one_or_none()
+                        if not order:
+                            continue
 
-                    # Load open orders
-                    result = await db.execute(
-                        select(GridOrder).where(
-                            GridOrder.grid_bot_id == grid_bot_id,
-                            GridOrder.status == 'open'
+                        result = await db.execute(
+                            select(GridBot).where(GridBot.id == order.grid_bot_id)
                         )
+                        bot = result.scalar_one_or_none()
+                        if not bot or bot.status != 'active':
+                            continue
+
+                        await self._process_filled_order(db, bot, order, status)
+                        await db.commit()
+
+            except asyncio.CancelledError:
+                break
+
+            except MEXCError as e:
+                logger.error("Order stream for user %s stopped: %s", user_id, e)
+                break
+
+            except Exception as e:
+                logger.error("Order stream error for user %s: %s", user_id, e)
+                await asyncio.sleep(_backoff_delay(retry_delay, max_retry_delay))
+                retry_delay = min(retry_delay * 2, max_retry_delay)
+
+        logger.info("Stopped order stream for user %s", user_id)
+
+    def _ensure_user_stream(self, user_id: int):
+        """Start user's order stream unless already running."""
+        task = self.user_streams.get(user_id)
+        if task is None or task.done():
+            self.user_streams[user_id] = asyncio.create_task(self._consume_ws(user_id))
+
+    def _release_user_stream(self, grid_bot_id: int):
+        """Stop user's order stream when their last monitored bot stops."""
+        user_id = self._bot_users.pop(grid_bot_id, None)
+        if user_id is None or user_id in self._bot_users.values():
+            return
+
+        task = self.user_streams.pop(user_id, None)
+        if task:
+            task.cancel()
+
+    async def _handle_check_error(self, db: AsyncSession, bot: GridBot, error: Exception):
+        """
+        Handle error fetching order statuses for bot.
+
+        Invalid API keys stop the bot; other errors are retried next tick.
+
+        Args:
+            db: DB session that loaded bot
+            bot: Grid bot
+            error: Raised exception
+        """
+        logger.error("Error checking orders of bot %s: %s", bot.id, error)
+
+        if not isinstance(error, MEXCError):
+            return
+
+        # Check if it's an authentication error
+        if (
+            isinstance(error, MEXCAuthError)
+            or 'authentication' in str(error).lower()
+            or 'api key' in str(error).lower()
+        ):
+            logger.error("API key invalid for bot %s, stopping", bot.id)
+
+            # Stop bot
+            bot.status = 'stopped'
+            await db.commit()
+            self.stop_monitoring(bot.id)
+
+            # Notify user
+            if self.notification:
+                await self.notification.notify_error(
+                    user_id=bot.user_id,
+                    grid_bot_id=bot.id,
+                    error_type='invalid_api_key',
+                    error_message='API ключи невалидны. Проверьте настройки.'
+                )
+
+    async def check_bots(self):
+        """
+        Check orders of all monitored bots once.
+
+        Algorithm:
+        1. Load monitored active bots with their open orders (2 queries:
+           bots + selectinload of orders filtered to status = 'open')
+        2. Drop bots that are no longer active from monitoring
+        3. Get order statuses from exchange for all bots concurrently
+           (one batch request per bot, max MAX_CONCURRENT_BOTS at a time)
+        4. Process filled orders (GridStrategy.handle_filled_order())
+        5. Update last_activity_at of bots with fills, or of bots whose
+           last write is older than ACTIVITY_PERSIST_INTERVAL
+        """
+        async with self.db_factory() as db:
+            result = await db.execute(
+                select(GridBot)
+                .where(
+                    GridBot.id.in_(self.monitored_bots),
+                    GridBot.status == 'active'
+                )
+                .options(
+                    selectinload(GridBot.orders),
+                    with_loader_criteria(GridOrder, GridOrder.status == 'open')
+                )
+            )
+            bots = result.scalars().all()
+
+            for grid_bot_id in self.monitored_bots - {bot.id for bot in bots}:
+                logger.info("Bot %s is not active, stopping monitoring", grid_bot_id)
+                self.stop_monitoring(grid_bot_id)
+
+            # Fills are pushed over user's WebSocket stream
+            for bot in bots:
+                self._bot_users[bot.id] = bot.user_id
+                self._ensure_user_stream(bot.user_id)
+
+            bots_with_orders = [bot for bot in bots if bot.orders]
+            changed: Set[int] = set()
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_BOTS)
+
+            async def fetch_statuses(bot: GridBot) -> Dict[str, dict]:
+                async with semaphore:
+                    return await self.mexc.get_orders_by_ids(
+                        user_id=bot.user_id,
+                        symbol=bot.symbol,
+                        order_ids=[o.exchange_order_id for o in bot.orders if o.exchange_order_id]
                     )
-                    open_orders = result.scalars().all()
 
-                    if not open_orders:
-                        logger.debug(f"No open orders for bot {grid_bot_id}")
-                        await asyncio.sleep(self.check_interval)
+            results = await asyncio.gather(
+                *(fetch_statuses(bot) for bot in bots_with_orders),
+                return_exceptions=True
+            )
+
+            for bot, statuses in zip(bots_with_orders, results):
+                if isinstance(statuses, Exception):
+                    await self._handle_check_error(db, bot, statuses)
+                    continue
+
+                # Process filled orders
+                for order in bot.orders:
+                    status = statuses.get(order.exchange_order_id)
+                    if not status or status['status'] != 'filled':
                         continue
 
-                    # Check each order
-                    for order in open_orders:
-                        try:
-                            # Get order status from exchange
-                            status = await self.mexc.get_order_status(
-                                user_id=bot.user_id,
-                                symbol=bot.symbol,
-                                order_id=order.exchange_order_id
-                            )
+                    try:
+                        if await self._process_filled_order(db, bot, order, status):
+                            changed.add(bot.id)
+                    except MEXCError as e:
+                        logger.error("MEXC error processing order %s: %s", order.id, e)
+                        # Continue with next order
+                        continue
 
-                            # If filled, process it
-                            if status['status'] == 'filled':
-                                logger.info(
-                                    f"Order {order.id} filled: {order.side} "
-                                    f"{order.amount} @ {order.price}"
-                                )
-
-                                # Update fee if available
-                                if status.get('fee'):
-                                    order.fee = status['fee']
-                                    order.fee_currency = status.get('fee_currency')
-
-                                # Handle filled order
-                                result = await self.grid_strategy.handle_filled_order(order.id)
-
-                                # Send notification
-                                if self.notification:
-                                    await self.notification.notify_order_filled(
-                                        user_id=bot.user_id,
-                                        grid_bot_id=grid_bot_id,
-                                        order={
-                                            'id': order.id,
-                                            'side': order.side,
-                                            'price': order.price,
-                                            'amount': order.amount,
-                                        },
-                                        new_order=result.get('new_order'),
-                                        profit=result.get('profit')
-                                    )
-
-                                # Check for profit milestone
-                                if result.get('cycle_completed') and bot.total_profit_percent > 0:
-                                    # Check if we reached a milestone (5%, 10%, etc.)
-                                    profit_milestones = [5, 10, 15, 20, 25, 30, 50, 75, 100]
-                                    current_milestone = int(bot.total_profit_percent // 5) * 5
-
-                                    if current_milestone in profit_milestones:
-                                        await self.notification.notify_profit_milestone(
-                                            user_id=bot.user_id,
-                                            grid_bot_id=grid_bot_id,
-                                            profit=bot.total_profit,
-                                            percent=Decimal(str(current_milestone))
-                                        )
-
-                        except MEXCError as e:
-                            logger.error(f"MEXC error checking order {order.id}: {e}")
-
-                            # Check if it's an authentication error
-                            if 'authentication' in str(e).lower() or 'api key' in str(e).lower():
-                                logger.error(f"API key invalid for bot {grid_bot_id}, stopping")
-
-                                # Stop bot
-                                bot.status = 'stopped'
-                                await db.commit()
-
-                                # Notify user
-                                if self.notification:
-                                    await self.notification.notify_error(
-                                        user_id=bot.user_id,
-                                        grid_bot_id=grid_bot_id,
-                                        error_type='invalid_api_key',
-                                        error_message='API ключи невалидны. Проверьте настройки.'
-                                    )
-
-                                return  # Exit monitoring
-
-                            # Continue with next order
-                            continue
+            # Update bots activity (skip the write when nothing is due)
+            now = datetime.utcnow()
+            now_ts = time.monotonic()
+            due = [
+                bot for bot in bots
+                if bot.status == 'active' and (
+                    bot.id in changed
+                    or now_ts - self._last_persist.get(bot.id, 0.0) > ACTIVITY_PERSIST_INTERVAL
+                )
+            ]
+            if not due and not changed:
+                return
+
+            for bot in due:
+                bot.last_activity_at = now
+                self._last_persist[bot.id] = now_ts
+            await db.commit()
+
+    async def run(self):
+        """
+        Infinite loop checking orders of all monitored bots.
 
-                    # Update bot activity
-                    bot.last_activity_at = datetime.utcnow()
-                    await db.commit()
+        Fills are normally processed as soon as MEXC pushes them over the
+        user's WebSocket stream (see _consume_ws); this loop is a periodic
+        reconciliation sweep (every check_interval seconds) catching
+        anything the stream missed.
 
-                    # Reset retry delay on success
-                    retry_delay = 1.0
+        Error handling:
+        - Network/DB errors → retry with jittered exponential backoff
+        - Invalid API key or signature → stop bot, notify (no retries)
+        """
+        logger.info("Starting order monitor")
+
+        # Random phase, so the sweep doesn't line up with startup requests
+        # (bot restore, price stream) or other processes started together
+        await asyncio.sleep(random.uniform(0, self.check_interval))
+
+        retry_delay = 1.0
+        max_retry_delay = 60.0
+
+        while True:
+            try:
+                if self.monitored_bots:
+                    await self.check_bots()
+
+                # Reset retry delay on success
+                retry_delay = 1.0
 
                 # Sleep before next check
                 await asyncio.sleep(self.check_interval)
 
             except asyncio.CancelledError:
-                logger.info(f"Monitoring cancelled for bot {grid_bot_id}")
+                logger.info("Order monitor cancelled")
                 break
 
             except Exception as e:
-                logger.error(f"Error monitoring bot {grid_bot_id}: {e}")
+                logger.error("Error monitoring orders: %s", e)
 
-                # Exponential backoff
-                await asyncio.sleep(retry_delay)
+                # Exponential backoff with jitter
+                await asyncio.sleep(_backoff_delay(retry_delay, max_retry_delay))
                 retry_delay = min(retry_delay * 2, max_retry_delay)
 
                 # Continue monitoring
                 continue
 
-        logger.info(f"Stopped monitoring for bot {grid_bot_id}")
+        logger.info("Stopped order monitor")
 
     def start_monitoring(self, grid_bot_id: int):
         """
         Start monitoring for bot.
 
-        Creates asyncio.Task and stores in self.active_monitors
+        Adds bot to the monitored set and starts the shared monitor task
+        (self.run) if it isn't running yet.
 
         Args:
             grid_bot_id: Grid bot ID
         """
-        if grid_bot_id in self.active_monitors:
-            logger.warning(f"Monitoring already active for bot {grid_bot_id}")
+        if grid_bot_id in self.monitored_bots:
+            logger.warning("Monitoring already active for bot %s", grid_bot_id)
             return
 
-        task = asyncio.create_task(self.monitor_bot_orders(grid_bot_id))
-        self.active_monitors[grid_bot_id] = task
+        self.monitored_bots.add(grid_bot_id)
 
-        logger.info(f"Started monitoring for bot {grid_bot_id}")
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+        logger.info("Started monitoring for bot %s", grid_bot_id)
 
     def stop_monitoring(self, grid_bot_id: int):
         """
@@ -237,14 +475,15 @@ class OrderMonitor:
         Args:
             grid_bot_id: Grid bot ID
         """
-        if grid_bot_id not in self.active_monitors:
-            logger.warning(f"No active monitoring for bot {grid_bot_id}")
+        if grid_bot_id not in self.monitored_bots:
+            logger.warning("No active monitoring for bot %s", grid_bot_id)
             return
 
-        task = self.active_monitors.pop(grid_bot_id)
-        task.cancel()
+        self.monitored_bots.discard(grid_bot_id)
+        self._last_persist.pop(grid_bot_id, None)
+        self._release_user_stream(grid_bot_id)
 
-        logger.info(f"Stopped monitoring for bot {grid_bot_id}")
+        logger.info("Stopped monitoring for bot %s", grid_bot_id)
 
     def is_monitoring(self, grid_bot_id: int) -> bool:
         """
@@ -256,12 +495,18 @@ class OrderMonitor:
         Returns:
             True if monitoring is active
         """
-        return grid_bot_id in self.active_monitors
+        return grid_bot_id in self.monitored_bots
 
     async def stop_all(self):
         """Stop all monitoring tasks."""
-        for grid_bot_id, task in list(self.active_monitors.items()):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+        for task in self.user_streams.values():
             task.cancel()
 
-        self.active_monitors.clear()
+        self.monitored_bots.clear()
+        self.user_streams.clear()
+        self._bot_users.clear()
         logger.info("Stopped all monitoring tasks")
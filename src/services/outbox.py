@@ -0,0 +1,180 @@
+"""Outbox dispatcher delivering stored events to notification service."""
+import asyncio
+from decimal import Decimal
+from functools import partial
+from typing import Optional, Dict, Set
+from datetime import datetime
+import logging
+from sqlalchemy import select, update
+
+from src.models.outbox_event import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# Events fetched per batch and idle poll interval (seconds)
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_POLL_INTERVAL = 2.0
+
+# Failed sends per event before it is dropped (e.g. user blocked the bot)
+OUTBOX_MAX_ATTEMPTS = 5
+
+# Payload fields stored as strings that are Decimals in notify_* arguments
+_DECIMAL_FIELDS = ('price', 'amount', 'profit', 'percent')
+
+
+def _decode(payload: dict) -> dict:
+    """Restore Decimal fields of event payload (one level of nested dicts)."""
+    decoded = {}
+    for key, value in payload.items():
+        if isinstance(value, dict):
+            value = _decode(value)
+        elif key in _DECIMAL_FIELDS and value is not None:
+            value = Decimal(value)
+        decoded[key] = value
+    return decoded
+
+
+class OutboxDispatcher:
+    """
+    Background task delivering outbox events.
+
+    Events are written by GridStrategy in the same transaction as the order
+    update. An event is marked delivered only after Telegram accepted the
+    message, so a failed send or a restart before that only delays it.
+    Delivery is at-least-once: a crash between the send and the delivered
+    mark sends the message again after restart.
+
+    In-flight events are tracked in memory, so run a single dispatcher per
+    database.
+    """
+
+    # Event kind -> NotificationService method
+    HANDLERS = {
+        'order_filled': 'notify_order_filled',
+        'profit_milestone': 'notify_profit_milestone',
+    }
+
+    def __init__(self, db_factory, notification_service):
+        """
+        Initialize outbox dispatcher.
+
+        Args:
+            db_factory: Function to create new DB session
+            notification_service: Notification service instance
+        """
+        self.db_factory = db_factory
+        self.notification = notification_service
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._in_flight: Set[int] = set()
+        self._attempts: Dict[int, int] = {}
+
+    def start(self):
+        """Start dispatcher task (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    def wake(self):
+        """Check for new events without waiting for the poll interval."""
+        self._wakeup.set()
+
+    async def dispatch_pending(self) -> int:
+        """
+        Queue one batch of undelivered events that aren't already queued.
+
+        Returns:
+            Number of events processed
+        """
+        query = (
+            select(OutboxEvent)
+            .where(OutboxEvent.delivered_at.is_(None))
+            .order_by(OutboxEvent.id)
+            .limit(OUTBOX_BATCH_SIZE)
+        )
+        if self._in_flight:
+            query = query.where(OutboxEvent.id.notin_(list(self._in_flight)))
+
+        async with self.db_factory() as db:
+            result = await db.execute(query)
+            events = result.scalars().all()
+
+        for event in events:
+            handler = self.HANDLERS.get(event.kind)
+            if handler is None:
+                logger.warning("Unknown outbox event kind %s (id=%s)", event.kind, event.id)
+                await self._mark_delivered(event.id)
+                continue
+
+            self._in_flight.add(event.id)
+            try:
+                await getattr(self.notification, handler)(
+                    **_decode(event.payload),
+                    on_done=partial(self._on_done, event.id)
+                )
+            except Exception:
+                self._in_flight.discard(event.id)
+                raise
+
+        return len(events)
+
+    async def _on_done(self, event_id: int, sent: bool):
+        """Mark event delivered after send, or leave it for the next poll."""
+        self._in_flight.discard(event_id)
+
+        if not sent:
+            attempts = self._attempts.get(event_id, 0) + 1
+            if attempts < OUTBOX_MAX_ATTEMPTS:
+                self._attempts[event_id] = attempts
+                return
+            logger.error("Dropping outbox event %s after %s failed sends", event_id, attempts)
+
+        self._attempts.pop(event_id, None)
+        await self._mark_delivered(event_id)
+
+    async def _mark_delivered(self, event_id: int):
+        """Set delivered_at of event."""
+        async with self.db_factory() as db:
+            await db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id == event_id)
+                .values(delivered_at=datetime.utcnow())
+            )
+            await db.commit()
+
+    async def run(self):
+        """Infinite loop draining the outbox."""
+        logger.info("Starting outbox dispatcher")
+
+        while True:
+            try:
+                if await self.dispatch_pending() == OUTBOX_BATCH_SIZE:
+                    continue
+
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), OUTBOX_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                logger.info("Outbox dispatcher cancelled")
+                break
+
+            except Exception as e:
+                logger.error("Error dispatching outbox events: %s", e)
+                await asyncio.sleep(OUTBOX_POLL_INTERVAL)
+
+        logger.info("Stopped outbox dispatcher")
+
+    async def stop(self):
+        """Stop dispatcher task."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
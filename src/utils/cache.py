@@ -1,12 +1,17 @@
 """Simple time-based cache for prices and other data."""
+import heapq
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from decimal import Decimal
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Number of get/set operations between reaps of expired entries
+REAP_EVERY = 64
+
+
 class SimpleCache:
     """Simple in-memory cache with TTL."""
 
@@ -18,7 +23,11 @@ class SimpleCache:
             ttl_seconds: Time to live for cache entries in seconds
         """
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # key -> (monotonic timestamp, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # (expiry, key) min-heap; may hold stale entries for overwritten keys
+        self._heap: List[Tuple[float, str]] = []
+        self._ops = 0
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -30,16 +39,21 @@ class SimpleCache:
         Returns:
             Cached value or None if expired/not found
         """
-        if key not in self._cache:
+        self._ops += 1
+        if self._ops >= REAP_EVERY:
+            self._reap()
+
+        entry = self._cache.get(key)
+        if entry is None:
             return None
 
-        entry = self._cache[key]
-        if time.time() - entry['timestamp'] > self.ttl_seconds:
+        timestamp, value = entry
+        if time.monotonic() - timestamp > self.ttl_seconds:
             # Expired, remove
-            del self._cache[key]
+            self._cache.pop(key, None)
             return None
 
-        return entry['value']
+        return value
 
     def set(self, key: str, value: Any):
         """
@@ -49,14 +63,30 @@ class SimpleCache:
             key: Cache key
             value: Value to cache
         """
-        self._cache[key] = {
-            'value': value,
-            'timestamp': time.time()
-        }
+        now = time.monotonic()
+        self._cache[key] = (now, value)
+        heapq.heappush(self._heap, (now + self.ttl_seconds, key))
+
+        self._ops += 1
+        if self._ops >= REAP_EVERY:
+            self._reap()
+
+    def _reap(self):
+        """Drop expired entries that were never read again."""
+        self._ops = 0
+        now = time.monotonic()
+        heap = self._heap
+        while heap and heap[0][0] < now:
+            _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Key may have been set again since this heap entry was pushed
+            if entry is not None and now - entry[0] > self.ttl_seconds:
+                del self._cache[key]
 
     def clear(self):
         """Clear all cache entries."""
         self._cache.clear()
+        self._heap.clear()
 
     def remove(self, key: str):
         """Remove specific key from cache."""
@@ -65,3 +95,8 @@ class SimpleCache:
 
 # Global price cache (60 seconds TTL)
 price_cache = SimpleCache(ttl_seconds=60)
+
+# Global balance cache (5 minutes TTL). Entries are invalidated explicitly
+# when the user places or cancels orders, TTL only covers external changes
+# (deposits, withdrawals, manual trades).
+balance_cache = SimpleCache(ttl_seconds=300)
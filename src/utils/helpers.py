@@ -1,13 +1,52 @@
 """Helper utilities."""
-from decimal import Decimal, ROUND_DOWN
-from typing import Optional, List
+import decimal
+from decimal import (
+    Decimal, ROUND_DOWN, ROUND_HALF_EVEN, InvalidOperation, DivisionByZero, Overflow,
+    Context, localcontext
+)
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, List, Dict, Iterable, Iterator, Callable
 import asyncio
+import bisect
 import logging
+import random
 
 logger = logging.getLogger(__name__)
 
-
-def parse_decimal(value: any, default: Decimal = Decimal('0')) -> Decimal:
+# Fixed arithmetic context for helper calculations. Rounding and traps
+# match the default context, so degenerate input raises instead of
+# yielding NaN/Infinity; truncation to exchange precision is done
+# explicitly with round_down().
+_CTX = Context(
+    prec=28,
+    rounding=ROUND_HALF_EVEN,
+    traps=[InvalidOperation, DivisionByZero, Overflow]
+)
+
+if not hasattr(decimal, '__libmpdec_version__'):
+    logger.warning("C decimal accelerator (_decimal) not available, using pure-Python decimal")
+
+# Shared Decimal constants (immutable)
+_D0 = Decimal(0)
+_D2 = Decimal(2)
+_D100 = Decimal(100)
+_DEFAULT_FEE = Decimal('0.1')
+
+# Suggested precision by magnitude: value < thresholds[0] -> precisions[0],
+# thresholds[i - 1] <= value < thresholds[i] -> precisions[i], and so on
+_PRICE_THRESHOLDS = (Decimal('0.1'), Decimal('1'), Decimal('10'))
+_PRICE_PRECISIONS = (8, 6, 4, 2)
+_AMOUNT_THRESHOLDS = (Decimal('1'), Decimal('1000'))
+_AMOUNT_PRECISIONS = (8, 4, 2)
+
+# Quantize templates by number of decimal places (round_down hot path)
+_QUANTIZE_CACHE: Dict[int, Decimal] = {
+    places: Decimal(1).scaleb(-places) for places in (2, 4, 6, 8)
+}
+
+
+def parse_decimal(value: any, default: Decimal = _D0) -> Decimal:
     """
     Safely parse value to Decimal.
 
@@ -21,16 +60,51 @@ def parse_decimal(value: any, default: Decimal = Decimal('0')) -> Decimal:
     if value is None:
         return default
 
-    if isinstance(value, Decimal):
+    # Fast paths by exact type, skipping str() where possible
+    value_type = type(value)
+    if value_type is Decimal:
         return value
+    if value_type is int:
+        return Decimal(value)
+    if value_type is float:
+        return Decimal(repr(value))
 
     try:
-        return Decimal(str(value))
-    except Exception as e:
-        logger.warning(f"Failed to parse decimal from {value}: {e}")
+        return Decimal(value if value_type is str else str(value))
+    except InvalidOperation as e:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Failed to parse decimal from %r: %s", value, e)
         return default
 
 
+def fast_decimal(value: any) -> Decimal:
+    """
+    Convert exchange response value to Decimal.
+
+    Faster than parse_decimal() for values that are already str/int/float:
+    strings (the common case for JSON prices/amounts) go to Decimal directly
+    instead of through str(). Invalid values fall back to parse_decimal().
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        Decimal value (Decimal('0') for None)
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, str):
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            return parse_decimal(value)
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, int):
+        return Decimal(value)
+    return parse_decimal(value)
+
+
 def round_down(value: Decimal, precision) -> Decimal:
     """
     Round down decimal to specified precision.
@@ -48,20 +122,51 @@ def round_down(value: Decimal, precision) -> Decimal:
         >>> round_down(Decimal('0.0382'), 0.001)  # step size 0.001
         Decimal('0.038')
     """
+    return value.quantize(_quantize_value(precision), rounding=ROUND_DOWN)
+
+
+def _quantize_value(precision) -> Decimal:
+    """Resolve precision (decimal places or step size) to a quantize exponent."""
     # Handle both formats:
     # - precision as int (number of decimal places): 8 -> 0.00000001
     # - precision as decimal step: 0.001 -> 0.001
     if isinstance(precision, Decimal):
-        quantize_value = precision
-    elif isinstance(precision, float) and precision < 1:
+        return precision
+    if isinstance(precision, float) and precision < 1:
         # It's a step size like 0.001, not decimal places
-        quantize_value = Decimal(str(precision))
-    else:
-        # It's number of decimal places (int or float >= 1)
-        precision = int(precision)
-        quantize_value = Decimal(10) ** -precision
+        return Decimal(str(precision))
+
+    # It's number of decimal places (int or float >= 1)
+    precision = int(precision)
+    quantize_value = _QUANTIZE_CACHE.get(precision)
+    if quantize_value is None:
+        quantize_value = _QUANTIZE_CACHE[precision] = Decimal(1).scaleb(-precision)
+    return quantize_value
+
 
-    return value.quantize(quantize_value, rounding=ROUND_DOWN)
+def make_rounder(precision) -> Callable[[Decimal], Decimal]:
+    """
+    Build round_down specialized for one precision.
+
+    For loops that round many values to the same symbol precision; the
+    precision is resolved once instead of on every call.
+
+    Args:
+        precision: Number of decimal places (int) OR step size (Decimal/float)
+
+    Returns:
+        Function rounding a Decimal down to that precision
+
+    Examples:
+        >>> make_rounder(3)(Decimal('0.0382'))
+        Decimal('0.038')
+    """
+    quantize_value = _quantize_value(precision)
+
+    def _round(value: Decimal, _q=quantize_value, _rounding=ROUND_DOWN) -> Decimal:
+        return value.quantize(_q, rounding=_rounding)
+
+    return _round
 
 
 def calculate_order_amount(
@@ -83,18 +188,37 @@ def calculate_order_amount(
         Order amount
     """
     if num_orders == 0 or price == 0:
-        return Decimal('0')
-
-    # Divide investment equally
-    amount_per_order = investment / Decimal(str(num_orders))
+        return _D0
 
-    # Calculate amount in base currency
-    amount = amount_per_order / price
+    # Amount in base currency per order
+    amount = investment / Decimal(num_orders) / price
 
     # Round down to precision
     return round_down(amount, precision)
 
 
+@lru_cache(maxsize=4096)
+def parse_symbol(symbol: str) -> Optional[tuple[str, str]]:
+    """
+    Parse trading pair with a single partition() call.
+
+    Cached, since symbols come from a small set of trading pairs. Shared by
+    split_symbol() and validators.validate_trading_pair().
+
+    Args:
+        symbol: Trading pair (e.g., BTC/USDT)
+
+    Returns:
+        Tuple of (base_currency, quote_currency) or None if format is invalid
+    """
+    # Exactly one '/' with non-empty base and quote
+    base, sep, quote = symbol.partition('/')
+    if not sep or not base or not quote or '/' in quote:
+        return None
+
+    return base, quote
+
+
 def split_symbol(symbol: str) -> tuple[str, str]:
     """
     Split trading pair into base and quote currencies.
@@ -104,12 +228,46 @@ def split_symbol(symbol: str) -> tuple[str, str]:
 
     Returns:
         Tuple of (base_currency, quote_currency)
+
+    Raises:
+        ValueError: If symbol is not in BASE/QUOTE format
     """
-    parts = symbol.split('/')
-    if len(parts) != 2:
+    parts = parse_symbol(symbol)
+    if parts is None:
         raise ValueError(f"Invalid symbol format: {symbol}")
 
-    return parts[0], parts[1]
+    return parts
+
+
+def _policy_delay(
+    policy: Optional[str],
+    attempt: int,
+    current_delay: float,
+    delay: float,
+    max_delay: float,
+    jitter: bool = True
+) -> float:
+    """
+    Get sleep time before next retry for given backoff policy.
+
+    Args:
+        policy: 'exponential' (full jitter), 'linear' or None (plain backoff)
+        attempt: Zero-based attempt number that just failed
+        current_delay: Delay of plain exponential backoff for this attempt
+        delay: Initial delay in seconds
+        max_delay: Upper bound for all delays
+        jitter: Randomize plain backoff in [0, delay] (full jitter)
+
+    Returns:
+        Delay in seconds
+    """
+    if policy == 'exponential':
+        return random.uniform(0, min(max_delay, delay * 2 ** attempt))
+    if policy == 'linear':
+        return min(max_delay, delay * (attempt + 1))
+    if jitter:
+        return random.uniform(0, min(max_delay, current_delay))
+    return min(max_delay, current_delay)
 
 
 async def retry_async(
@@ -119,11 +277,18 @@ async def retry_async(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
+    backoff_policy: Optional[Dict[type, str]] = None,
+    jitter: bool = True,
+    max_delay: float = 60.0,
     **kwargs
 ):
     """
     Retry async function with exponential backoff.
 
+    Retries of many callers failing on the same outage are spread out with
+    full jitter (sleep uniformly in [0, current delay]) instead of firing in
+    lockstep.
+
     Args:
         func: Async function to retry
         *args: Function arguments
@@ -131,6 +296,13 @@ async def retry_async(
         delay: Initial delay in seconds
         backoff: Backoff multiplier
         exceptions: Exceptions to catch
+        backoff_policy: Per-exception backoff, e.g.
+            {ccxt.DDoSProtection: 'exponential', ccxt.RequestTimeout: 'linear'}.
+            'exponential' uses full jitter, 'linear' grows by `delay` per
+            attempt. Unlisted exceptions use plain backoff.
+        jitter: Use full jitter for plain backoff (False for deterministic
+            delays)
+        max_delay: Upper bound for any delay between attempts
         **kwargs: Function keyword arguments
 
     Returns:
@@ -141,27 +313,39 @@ async def retry_async(
     """
     current_delay = delay
 
-    for attempt in range(max_retries + 1):
+    # Sleep only between attempts; the last attempt runs outside the loop
+    for attempt in range(max_retries):
         try:
             return await func(*args, **kwargs)
         except exceptions as e:
-            if attempt == max_retries:
-                logger.error(f"All {max_retries} retries failed for {func.__name__}: {e}")
-                raise
+            policy = None
+            if backoff_policy:
+                for exc_type, exc_policy in backoff_policy.items():
+                    if isinstance(e, exc_type):
+                        policy = exc_policy
+                        break
+
+            sleep_for = _policy_delay(policy, attempt, current_delay, delay, max_delay, jitter)
 
             logger.warning(
-                f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {e}. "
-                f"Retrying in {current_delay}s..."
+                "Attempt %d/%d failed for %s: %s. Retrying in %.2fs...",
+                attempt + 1, max_retries, func.__name__, e, sleep_for
             )
-            await asyncio.sleep(current_delay)
+            await asyncio.sleep(sleep_for)
             current_delay *= backoff
 
+    try:
+        return await func(*args, **kwargs)
+    except exceptions as e:
+        logger.error("All %d retries failed for %s: %s", max_retries, func.__name__, e)
+        raise
+
 
 def calculate_grid_profit_potential(
     lower_price: Decimal,
     upper_price: Decimal,
     grid_levels: int,
-    fee_percent: Decimal = Decimal('0.1')
+    fee_percent: Decimal = _DEFAULT_FEE
 ) -> Decimal:
     """
     Calculate potential profit per cycle for grid bot.
@@ -176,21 +360,22 @@ def calculate_grid_profit_potential(
         Profit percentage per cycle
     """
     if grid_levels == 0:
-        return Decimal('0')
+        return _D0
 
-    # Calculate grid step
-    grid_step = (upper_price - lower_price) / Decimal(str(grid_levels))
+    with localcontext(_CTX):
+        # Calculate grid step
+        grid_step = (upper_price - lower_price) / Decimal(grid_levels)
 
-    # Average price
-    avg_price = (lower_price + upper_price) / 2
+        # Average price
+        avg_price = (lower_price + upper_price) / _D2
 
-    # Profit per grid step
-    step_profit_percent = (grid_step / avg_price) * 100
+        # Profit per grid step
+        step_profit_percent = (grid_step / avg_price) * _D100
 
-    # Subtract fees (buy + sell)
-    net_profit = step_profit_percent - (fee_percent * 2)
+        # Subtract fees (buy + sell)
+        net_profit = step_profit_percent - (fee_percent * _D2)
 
-    return max(net_profit, Decimal('0'))
+        return max(net_profit, _D0)
 
 
 def get_price_precision(price: Decimal) -> int:
@@ -203,18 +388,7 @@ def get_price_precision(price: Decimal) -> int:
     Returns:
         Suggested precision
     """
-    if price >= 1000:
-        return 2
-    elif price >= 100:
-        return 2
-    elif price >= 10:
-        return 2
-    elif price >= 1:
-        return 4
-    elif price >= 0.1:
-        return 6
-    else:
-        return 8
+    return _PRICE_PRECISIONS[bisect.bisect_right(_PRICE_THRESHOLDS, price)]
 
 
 def get_amount_precision(amount: Decimal) -> int:
@@ -227,12 +401,26 @@ def get_amount_precision(amount: Decimal) -> int:
     Returns:
         Suggested precision
     """
-    if amount >= 1000:
-        return 2
-    elif amount >= 1:
-        return 4
-    else:
-        return 8
+    return _AMOUNT_PRECISIONS[bisect.bisect_right(_AMOUNT_THRESHOLDS, amount)]
+
+
+def iter_chunks(items: Iterable, chunk_size: int) -> Iterator[List]:
+    """
+    Lazily split iterable into chunks.
+
+    Args:
+        items: Iterable to split
+        chunk_size: Size of each chunk
+
+    Yields:
+        Lists of up to chunk_size items
+    """
+    it = iter(items)
+    while True:
+        batch = list(islice(it, chunk_size))
+        if not batch:
+            return
+        yield batch
 
 
 def chunk_list(items: List, chunk_size: int) -> List[List]:
@@ -246,10 +434,14 @@ def chunk_list(items: List, chunk_size: int) -> List[List]:
     Returns:
         List of chunks
     """
-    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    # Slicing is fastest for sequences; other iterables go through iter_chunks
+    if isinstance(items, (list, tuple)):
+        return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    return list(iter_chunks(items, chunk_size))
 
 
-def safe_divide(numerator: Decimal, denominator: Decimal, default: Decimal = Decimal('0')) -> Decimal:
+def safe_divide(numerator: Decimal, denominator: Decimal, default: Decimal = _D0) -> Decimal:
     """
     Safely divide two decimals.
 
@@ -261,11 +453,20 @@ def safe_divide(numerator: Decimal, denominator: Decimal, default: Decimal = Dec
     Returns:
         Division result or default
     """
-    if denominator == 0:
+    if denominator is _D0:
+        return default
+
+    # NaN/Infinity denominator gives no meaningful result
+    if isinstance(denominator, Decimal) and not denominator.is_finite():
+        return default
+
+    # Decimal is falsy exactly for zero, whatever the exponent
+    if not denominator:
         return default
 
     try:
-        return numerator / denominator
-    except Exception as e:
-        logger.warning(f"Division failed: {e}")
+        with localcontext(_CTX):
+            return numerator / denominator
+    except (TypeError, ArithmeticError) as e:
+        logger.warning("Division failed: %s", e)
         return default
@@ -2,10 +2,17 @@
 from decimal import Decimal
 from typing import Optional
 from src.core.config import settings
+from src.utils.helpers import parse_symbol
 import logging
 
 logger = logging.getLogger(__name__)
 
+_D100 = Decimal(100)
+_MIN_RANGE_PERCENT = Decimal(2)
+
+# Settings are read once at startup, so this is fixed until restart
+_MIN_INV = Decimal(str(settings.MIN_INVESTMENT_USDT))
+
 
 class ValidationError(Exception):
     """Custom validation error."""
@@ -37,8 +44,8 @@ def validate_price_range(lower_price: Decimal, upper_price: Decimal, current_pri
         raise ValidationError("Нижняя граница должна быть меньше верхней")
 
     # Check minimum range (2%)
-    range_percent = (upper_price - lower_price) / lower_price * 100
-    if range_percent < 2:
+    range_percent = (upper_price - lower_price) / lower_price * _D100
+    if range_percent < _MIN_RANGE_PERCENT:
         raise ValidationError("Диапазон слишком узкий (минимум 2%)")
 
     # Validate current price is within range if provided
@@ -88,7 +95,7 @@ def validate_investment_amount(amount: Decimal, available_balance: Optional[Deci
     Raises:
         ValidationError: If validation fails
     """
-    if amount < Decimal(str(settings.MIN_INVESTMENT_USDT)):
+    if amount < _MIN_INV:
         raise ValidationError(f"Минимальная сумма инвестиций: ${settings.MIN_INVESTMENT_USDT}")
 
     if available_balance is not None and amount > available_balance:
@@ -113,17 +120,9 @@ def validate_trading_pair(symbol: str) -> bool:
     Raises:
         ValidationError: If validation fails
     """
-    if not symbol or '/' not in symbol:
+    if not symbol or parse_symbol(symbol) is None:
         raise ValidationError("Неверный формат торговой пары. Используйте формат: BTC/USDT")
 
-    parts = symbol.split('/')
-    if len(parts) != 2:
-        raise ValidationError("Неверный формат торговой пары. Используйте формат: BTC/USDT")
-
-    base, quote = parts
-    if not base or not quote:
-        raise ValidationError("Неверный формат торговой пары")
-
     return True
 
 
@@ -0,0 +1,47 @@
+"""Tests for helper calculations."""
+from decimal import Decimal
+
+import pytest
+
+from src.utils.helpers import (
+    calculate_grid_profit_potential,
+    calculate_order_amount,
+    safe_divide,
+)
+
+
+@pytest.mark.parametrize('investment, price, num_orders, precision, expected', [
+    (Decimal('29'), Decimal('100'), 1, 2, Decimal('0.29')),
+    (Decimal('100'), Decimal('3'), 1, 4, Decimal('33.3333')),
+    (Decimal('1000'), Decimal('0.07'), 10, 0, Decimal('1428')),
+    (Decimal('29'), Decimal('100'), 1, Decimal('0.001'), Decimal('0.290')),
+    (Decimal('10'), Decimal('3'), 1, 0.01, Decimal('3.33')),
+    (Decimal('10'), Decimal('0'), 1, 2, Decimal('0')),
+    (Decimal('10'), Decimal('3'), 0, 2, Decimal('0')),
+])
+def test_calculate_order_amount_rounds_down_exactly(investment, price, num_orders, precision, expected):
+    assert calculate_order_amount(investment, price, num_orders, precision) == expected
+
+
+@pytest.mark.parametrize('denominator', [
+    Decimal('0'), Decimal('0.000'), Decimal('NaN'), Decimal('sNaN'), Decimal('Infinity'), 0.5,
+])
+def test_safe_divide_returns_default(denominator):
+    assert safe_divide(Decimal('1'), denominator, Decimal('-1')) == Decimal('-1')
+
+
+def test_safe_divide():
+    assert safe_divide(Decimal('1'), Decimal('4')) == Decimal('0.25')
+    assert safe_divide(Decimal('1'), 4) == Decimal('0.25')
+
+
+def test_calculate_grid_profit_potential_rounds_half_even():
+    # 2/3 * 100 - 0.2 at 28 digits: last digit rounds up, not truncated
+    assert calculate_grid_profit_potential(
+        Decimal('99'), Decimal('101'), 3
+    ) == Decimal('0.4666666666666666666666666667')
+
+
+def test_calculate_grid_profit_potential_raises_on_degenerate_range():
+    with pytest.raises(ArithmeticError):
+        calculate_grid_profit_potential(Decimal('0'), Decimal('0'), 3)
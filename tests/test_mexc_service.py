@@ -0,0 +1,45 @@
+"""Tests for MEXC balance caching."""
+import pytest
+
+from src.services import mexc_service
+from src.services.mexc_service import MEXCService
+
+
+class FakeExchange:
+    """Exchange whose balance fetch runs `during_fetch` before returning."""
+
+    def __init__(self, during_fetch=None):
+        self.during_fetch = during_fetch
+        self.fetches = 0
+
+    async def fetch_balance(self):
+        self.fetches += 1
+        if self.during_fetch is not None:
+            self.during_fetch()
+        return {'total': {'USDT': 100.0}}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(mexc_service, '_balance_dirty', set())
+    mexc_service.balance_cache.clear()
+    yield MEXCService(db=None)
+    mexc_service.balance_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_balance_marked_dirty_during_fetch_is_not_cached(service, monkeypatch):
+    exchange = FakeExchange(during_fetch=lambda: mexc_service._balance_dirty.add(1))
+
+    async def get_exchange(user_id):
+        return exchange
+
+    monkeypatch.setattr(service, '_get_exchange', get_exchange)
+
+    await service.get_balance(1)
+    exchange.during_fetch = None
+    await service.get_balance(1)
+    await service.get_balance(1)
+
+    assert exchange.fetches == 2
+    assert 1 not in mexc_service._balance_dirty
@@ -0,0 +1,75 @@
+"""Tests for notification delivery."""
+from decimal import Decimal
+
+import pytest
+
+from src.services import notification
+from src.services.notification import NotificationService
+
+ORDER = {'id': 1, 'side': 'buy', 'price': Decimal('100'), 'amount': Decimal('0.5')}
+
+
+class FakeBot:
+    """Bot recording sent messages, failing the first `failures` sends."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.sent = []
+
+    async def send_message(self, chat_id, text, reply_markup=None):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("Telegram is down")
+        self.sent.append(chat_id)
+
+
+@pytest.fixture(autouse=True)
+def no_chat_interval(monkeypatch):
+    monkeypatch.setattr(notification, 'CHAT_MESSAGE_INTERVAL', 0)
+
+
+@pytest.mark.asyncio
+async def test_outbox_duplicate_fill_is_sent_once():
+    service = NotificationService(FakeBot())
+    results = []
+
+    async def on_done(sent):
+        results.append(sent)
+
+    await service.notify_order_filled(7, 3, ORDER, on_done=on_done)
+    await service.notify_order_filled(7, 3, ORDER, on_done=on_done)
+    await service.close()
+
+    assert service.bot.sent == [7]
+    assert results == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_outbox_retry_after_failed_send_is_not_deduplicated():
+    service = NotificationService(FakeBot(failures=1))
+    results = []
+
+    async def on_done(sent):
+        results.append(sent)
+
+    await service.notify_order_filled(7, 3, ORDER, on_done=on_done)
+    await service.close()
+    await service.notify_order_filled(7, 3, ORDER, on_done=on_done)
+    await service.close()
+
+    assert service.bot.sent == [7]
+    assert results == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_idle_chat_state_is_pruned():
+    service = NotificationService(FakeBot())
+
+    for chat_id in range(1, 6):
+        await service.notify_order_filled(chat_id, chat_id, ORDER)
+    await service.close()
+
+    assert service.bot.sent == [1, 2, 3, 4, 5]
+    assert service._chat_locks == {}
+    assert service._chat_pending == {}
+    assert service._chat_last_sent == {}
@@ -0,0 +1,125 @@
+"""Tests for order monitor reconciliation sweep."""
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.grid_bot import GridBot
+from src.models.order import GridOrder
+from src.services import mexc_service
+from src.services.mexc_service import MEXCService
+from src.services.order_monitor import OrderMonitor
+
+
+class FakeResult:
+    """Result of FakeSession.execute()."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """AsyncSession stand-in that fails on concurrent operations, like asyncpg."""
+
+    def __init__(self, bots):
+        self.bots = bots
+        self.busy = False
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        if self.busy:
+            raise RuntimeError("another operation is in progress")
+
+        self.busy = True
+        try:
+            await asyncio.sleep(0)
+        finally:
+            self.busy = False
+
+        if statement is mexc_service._USER_KEYS_STMT:
+            return FakeResult([SimpleNamespace(mexc_api_key='key', mexc_api_secret='secret')])
+        return FakeResult(self.bots)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class FakeExchange:
+    """Exchange reporting every order as open."""
+
+    def __init__(self, config):
+        pass
+
+    async def fetch_open_orders(self, symbol):
+        await asyncio.sleep(0)
+        return [
+            {'id': f"ex{bot_id}", 'status': 'open', 'side': 'buy', 'price': '100', 'amount': '1'}
+            for bot_id in range(1, 5)
+        ]
+
+    async def close(self):
+        pass
+
+
+def make_bot(bot_id: int, user_id: int) -> GridBot:
+    bot = GridBot(
+        id=bot_id,
+        user_id=user_id,
+        symbol='BTC/USDT',
+        status='active',
+        total_profit_percent=Decimal('0'),
+    )
+    bot.orders = [GridOrder(id=bot_id * 10, exchange_order_id=f"ex{bot_id}", status='open')]
+    return bot
+
+
+@pytest.mark.asyncio
+async def test_check_bots_with_several_bots_shares_no_session(monkeypatch):
+    bots = [make_bot(bot_id, user_id=bot_id) for bot_id in range(1, 5)]
+    shared_session = FakeSession(bots)
+
+    monkeypatch.setattr(mexc_service, '_create_exchange', FakeExchange)
+    monkeypatch.setattr(mexc_service, '_user_exchanges', mexc_service.OrderedDict())
+    monkeypatch.setattr(mexc_service, 'security', SimpleNamespace(
+        decrypt_api_credentials=lambda key, secret: (key, secret)
+    ))
+
+    mexc = MEXCService(shared_session, db_factory=lambda: FakeSession(bots))
+    monitor = OrderMonitor(
+        db_factory=lambda: shared_session,
+        mexc_service=mexc,
+        grid_strategy=None,
+        notification_service=None,
+    )
+    monkeypatch.setattr(monitor, '_ensure_user_stream', lambda user_id: None)
+
+    errors = []
+
+    async def record_error(db, bot, error):
+        errors.append(error)
+
+    monkeypatch.setattr(monitor, '_handle_check_error', record_error)
+
+    for bot in bots:
+        monitor.monitored_bots.add(bot.id)
+
+    await monitor.check_bots()
+
+    assert errors == []
+    assert shared_session.commits == 1
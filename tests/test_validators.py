@@ -0,0 +1,15 @@
+"""Tests for input validators."""
+from decimal import Decimal
+
+import pytest
+
+from src.utils.validators import ValidationError, validate_price_range
+
+
+def test_validate_price_range_accepts_exact_minimum_width():
+    assert validate_price_range(Decimal('0.1'), Decimal('0.102'))
+
+
+def test_validate_price_range_rejects_narrow_range():
+    with pytest.raises(ValidationError):
+        validate_price_range(Decimal('0.1'), Decimal('0.1019'))